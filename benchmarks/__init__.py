@@ -0,0 +1,24 @@
+import math
+import statistics
+import time
+
+
+def time_resolver(resolve, lines, repeats):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        resolve(lines)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {'median': statistics.median(ordered), 'p95': p95, 'runs': len(ordered)}
+
+
+def find_regressions(results, baseline, threshold):
+    def is_regression(key):
+        return key in baseline and results[key]['median'] > baseline[key]['median'] * (1 + threshold)
+    return [(key, baseline[key]['median'], results[key]['median']) for key in results if is_regression(key)]
@@ -0,0 +1,67 @@
+import argparse
+import functools
+import json
+import os
+import sys
+
+from benchmarks import find_regressions, summarize, time_resolver
+from benchmarks.scaling import SCALING_AXES, scaled_inputs
+from runner import DAYS, default_input_file, import_day, parse_days, parts_to_solve, read_lines, resolve
+
+
+def benchmark_day(day, parts, args):
+    daily_module = import_day(day)
+    resolvers = [(part, functools.partial(resolve, daily_module, part)) for part in parts]
+    input_file = os.path.join(args['input_dir'], default_input_file(day))
+    if os.path.exists(input_file):
+        lines = read_lines(input_file)
+        for part, resolve_part in resolvers:
+            yield f'day_{day}/part{part}', summarize(time_resolver(resolve_part, lines, args['repeats']))
+    if args['scaling'] and day in SCALING_AXES:
+        axis = SCALING_AXES[day][0]
+        for size, lines in scaled_inputs(day, args['seed']):
+            for part, resolve_part in resolvers:
+                yield f'day_{day}/part{part}/{axis}={size}', summarize(time_resolver(resolve_part, lines, args['repeats']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Advent of code 2021 benchmarks')
+    parser.add_argument('--days', help='days to benchmark, e.g. 1-25 or 1,3,5-7', type=parse_days, default=list(DAYS))
+    parser.add_argument('--part', '-p', help='part of puzzle to benchmark', choices=['1', '2', 'both'], default='both')
+    parser.add_argument('--repeats', '-n', help='timed runs per part', type=int, default=5)
+    parser.add_argument('--input-dir', help='directory with day_N.in puzzle inputs', default='.')
+    parser.add_argument('--scaling', help='also time synthetic inputs grown along each day\'s scale axis', action='store_true')
+    parser.add_argument('--seed', help='seed for synthetic inputs', type=int, default=2021)
+    parser.add_argument('--baseline', help='baseline file to compare against')
+    parser.add_argument('--save-baseline', help='store results as the new baseline', action='store_true')
+    parser.add_argument('--threshold', help='allowed relative slowdown of the median', type=float, default=0.25)
+    parser.add_argument('--report', help='file for JSON results')
+
+    args = vars(parser.parse_args())
+
+    results = {}
+    for day in args['days']:
+        for key, stats in benchmark_day(day, parts_to_solve(args['part']), args):
+            print(f'{key:<40} median {stats["median"]:10.4f} s   p95 {stats["p95"]:10.4f} s')
+            results[key] = stats
+
+    if args['report'] is not None:
+        with open(args['report'], 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args['baseline'] is None:
+        return
+    if args['save_baseline']:
+        with open(args['baseline'], 'w') as file:
+            json.dump(results, file, indent=2)
+        return
+    with open(args['baseline']) as file:
+        baseline = json.load(file)
+    regressions = find_regressions(results, baseline, args['threshold'])
+    for key, expected, actual in regressions:
+        print(f'REGRESSION {key}: median {actual:.4f} s vs baseline {expected:.4f} s')
+    if regressions:
+        sys.exit(1)
+
+
+main()
@@ -0,0 +1,24 @@
+from generators import generate_lines
+
+
+SCALING_AXES = {
+    5: ('lines', (500, 1000, 2000)),
+    9: ('size', (25, 50, 100)),
+    10: ('lines', (1000, 2000, 4000)),
+    15: ('size', (10, 20, 40)),
+    19: ('scanners', (2, 3, 4)),
+    20: ('size', (5, 10, 20)),
+    25: ('size', (20, 40, 80)),
+}
+
+
+def generator_params(day, size):
+    if day == 25:
+        return {'width': size, 'height': size}
+    return {SCALING_AXES[day][0]: size}
+
+
+def scaled_inputs(day, seed, sizes=None):
+    _, default_sizes = SCALING_AXES[day]
+    for size in sizes or default_sizes:
+        yield size, generate_lines(day, seed, **generator_params(day, size))
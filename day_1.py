@@ -1,16 +1,44 @@
+from array import array
+from itertools import islice
+from operator import lt
+
+
 def convert_measurements(input):
-    return [int(num) for num in input]
+    return array('q', map(int, input))
+
 
+def count_window_increases(numbers, window):
+    # Sums of windows starting at i and i + 1 share all but two numbers, so comparing
+    # numbers[i] with numbers[i + window] is enough and no window sum is ever built.
+    return sum(map(lt, numbers, islice(numbers, window, None)))
 
-def count_increases(numbers):
-    return sum(1 for current, next in zip(numbers, numbers[1:]) if current < next)
+
+def count_window_increases_stream(numbers, window):
+    numbers = iter(numbers)
+    ring = array('q', islice(numbers, window))
+    increases = 0
+    for idx, number in enumerate(numbers):
+        slot = idx % window
+        increases += ring[slot] < number
+        ring[slot] = number
+    return increases
     
 
-def resolve_part1(input):
-    return count_increases(convert_measurements(input))
+def parse(input):
+    return convert_measurements(input)
+
+
+def resolve_part1(measurements):
+    return count_window_increases(measurements, window=1)
+
+
+def resolve_part2(measurements):
+    return count_window_increases(measurements, window=3)
+
+
+def resolve_part1_stream(input):
+    return count_window_increases_stream(map(int, input), window=1)
 
 
-def resolve_part2(input):
-    measurements = convert_measurements(input)
-    slided_measurements = [a + b + c for a, b, c in zip(measurements, measurements[1:], measurements[2:])]
-    return count_increases(slided_measurements)
+def resolve_part2_stream(input):
+    return count_window_increases_stream(map(int, input), window=3)
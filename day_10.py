@@ -1,61 +1,72 @@
+from typing import NamedTuple, Optional
+
+from selection import introselect
+
+
 BRACKET_MATCHES = {
     '(': ')',
     '[': ']',
     '{': '}',
     '<': '>',
 }
+OPENINGS = ''.join(BRACKET_MATCHES.keys())
+CLOSINGS = ''.join(BRACKET_MATCHES.values())
+# Openings become codes 0 to 3 and their closings the same code plus CLOSING_CODE.
+CLOSING_CODE = len(OPENINGS)
+BRACKET_CODES = str.maketrans(OPENINGS + CLOSINGS, ''.join(map(chr, range(2 * CLOSING_CODE))))
+SYNTAX_ERROR_SCORES = {')': 3, ']': 57, '}': 1197, '>': 25137}
+
+CORRUPTED = 'corrupted'
+INCOMPLETE = 'incomplete'
+COMPLETE = 'complete'
+
+
+class LineCheck(NamedTuple):
+    status: str
+    illegal_char: Optional[str] = None
+    completion_score: int = 0
+
+
+def check_line(line):
+    # Incomplete lines are scored from the openings left on the stack.
+    opened = bytearray()
+    for code in line.translate(BRACKET_CODES).encode():
+        if code < CLOSING_CODE:
+            opened.append(code)
+        elif not opened or opened.pop() != code - CLOSING_CODE:
+            return LineCheck(CORRUPTED, illegal_char=CLOSINGS[code - CLOSING_CODE])
+    if not opened:
+        return LineCheck(COMPLETE)
+    score = 0
+    for code in reversed(opened):
+        score = 5 * score + code + 1
+    return LineCheck(INCOMPLETE, completion_score=score)
 
 
-def find_first_incorrect_closing(chunks):
-    opened_chunks = []
-    for char in chunks:
-        if char in BRACKET_MATCHES.keys():
-            opened_chunks.append(char)
-        else:
-            chunk_opening = opened_chunks.pop()
-            if char != BRACKET_MATCHES[chunk_opening]:
-                return char
-    return None
-
-
-def score_syntax_errors(navigation):
-    score_table = {')': 3, ']': 57, '}': 1197, '>': 25137}
-    broken_brackets = filter(lambda x: x is not None, map(find_first_incorrect_closing, navigation))
-    return sum(score_table[illegal] for illegal in broken_brackets)
+def score_syntax_errors(checks):
+    return sum(SYNTAX_ERROR_SCORES[check.illegal_char] for check in checks if check.status == CORRUPTED)
 
 
-def filter_incomplete_lines(navigation):
-    return filter(lambda chunks: find_first_incorrect_closing(chunks) is None, navigation)
+def get_middle_score(scores):
+    return introselect(scores, len(scores) // 2)
 
 
-def find_chunks_completion(chunks):
-    opened_chunks = []
-    for char in chunks:
-        if char in BRACKET_MATCHES.keys():
-            opened_chunks.append(char)
-        else:
-            opened_chunks.pop()
-    opened_chunks.reverse()
-    return [BRACKET_MATCHES[opening] for opening in opened_chunks]
+def collect_completion_scores(checks):
+    return [check.completion_score for check in checks if check.status == INCOMPLETE]
 
 
-def score_completion(completion):
-    score_table = {')': 1, ']': 2, '}': 3, '>': 4}
-    score = 0
-    for bracket in completion:
-        score = 5 * score + score_table[bracket]
-    return score
+def resolve_part1(navigation):
+    return score_syntax_errors(map(check_line, navigation))
 
 
-def get_middle_score(completions):
-    scoretable = sorted(map(score_completion, completions))
-    return scoretable[len(scoretable) // 2]
+def resolve_part2(navigation):
+    return get_middle_score(collect_completion_scores(map(check_line, navigation)))
 
 
-def resolve_part1(input):
-    return score_syntax_errors(input)
+# Defined only so the runner streams the lines instead of falling back to the memory-mapped view.
+def resolve_part1_stream(input):
+    return resolve_part1(input)
 
 
-def resolve_part2(input):
-    completions = map(find_chunks_completion, filter_incomplete_lines(input))
-    return get_middle_score(completions)
\ No newline at end of file
+def resolve_part2_stream(input):
+    return resolve_part2(input)
@@ -82,9 +82,13 @@ def find_synchronization_point(octopus_grid):
     return next(filter(are_all_octopuses_flashed, itertools.count(1)))
 
 
-def resolve_part1(input):
-    return count_flashes(parse_energy_levels(input), steps=100)
+def parse(input):
+    return parse_energy_levels(input)
 
 
-def resolve_part2(input):
-    return find_synchronization_point(parse_energy_levels(input))
\ No newline at end of file
+def resolve_part1(energy_levels):
+    return count_flashes(energy_levels, steps=100)
+
+
+def resolve_part2(energy_levels):
+    return find_synchronization_point(energy_levels)
\ No newline at end of file
@@ -1,3 +1,6 @@
+from progress import advance_progress, is_listening
+
+
 START = 'start'
 END = 'end'
 
@@ -71,7 +74,7 @@ class PathTraverserB:
         self.path.append(cave)
 
 
-def count_all_path_continuations(graph, path_traverser):
+def count_all_path_continuations(graph, path_traverser, report=False):
     traverser_type = type(path_traverser)
     current_cave = path_traverser.path[-1]
     current_node = graph[current_cave]
@@ -81,22 +84,28 @@ def count_all_path_continuations(graph, path_traverser):
             continue
         if cave == END:
             path_continuations += 1
+            if report:
+                advance_progress('paths_found')
         else:
             new_path = traverser_type(path_traverser)
             new_path.extend_path(cave)
-            path_continuations += count_all_path_continuations(graph, new_path)
+            path_continuations += count_all_path_continuations(graph, new_path, report)
     return path_continuations
 
 
 def count_all_possible_paths(graph, traverser_type):
     start = traverser_type()
     start.extend_path(START)
-    return count_all_path_continuations(graph, start)
+    return count_all_path_continuations(graph, start, report=is_listening())
+
+
+def parse(input):
+    return parse_caves_graph(input)
 
 
-def resolve_part1(input):
-    return count_all_possible_paths(parse_caves_graph(input), PathTraverserA)
+def resolve_part1(graph):
+    return count_all_possible_paths(graph, PathTraverserA)
 
 
-def resolve_part2(input):
-    return count_all_possible_paths(parse_caves_graph(input), PathTraverserB)
\ No newline at end of file
+def resolve_part2(graph):
+    return count_all_possible_paths(graph, PathTraverserB)
\ No newline at end of file
@@ -65,13 +65,17 @@ def strigify_paper(points):
     return '\n'.join(''.join(row) for row in display)
 
 
-def resolve_part1(input):
-    points, folds = parse_paper(input)
+def parse(input):
+    return parse_paper(input)
+
+
+def resolve_part1(paper):
+    points, folds = paper
     return len(apply_fold(points, folds[0]))
 
 
-def resolve_part2(input):
-    points, folds = parse_paper(input)
+def resolve_part2(paper):
+    points, folds = paper
     for fold in folds:
         points = apply_fold(points, fold)
     return '\n' + strigify_paper(points)
\ No newline at end of file
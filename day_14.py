@@ -48,11 +48,15 @@ def get_min_max_difference(polymers_counter):
     return max_quantity - min_quantity
 
 
-def resolve_part1(input):
-    template, rules = parse_polymer_formula(input)
+def parse(input):
+    return parse_polymer_formula(input)
+
+
+def resolve_part1(polymer_formula):
+    template, rules = polymer_formula
     return get_min_max_difference(count_polymers(template, rules, steps=10))
 
 
-def resolve_part2(input):
-    template, rules = parse_polymer_formula(input)
+def resolve_part2(polymer_formula):
+    template, rules = polymer_formula
     return get_min_max_difference(count_polymers(template, rules, steps=40))
\ No newline at end of file
@@ -1,12 +1,15 @@
-from typing import Tuple
-from day_9 import neighbours_of_point
 import heapq
 from dataclasses import dataclass
 
+from flat_grid import grid_from_rows, parse_digit_grid
+
+
+TILES_PER_SIDE = 5
+
 
 @dataclass
 class Node:
-    coords: Tuple[int, int]
+    index: int
     value: int
     cost: int
     heuristic_val: int
@@ -17,13 +20,11 @@ class Node:
 
 
 def parse_risk_level_map(input):
-    return [[int(num) for num in line] for line in input]
+    return parse_digit_grid(input)
 
 
 def get_target_point(map):
-    width = len(map[0])
-    height = len(map)
-    return (width - 1, height - 1)
+    return (map.width - 1, map.height - 1)
 
 
 def manhattan_dist(ptA, ptB):
@@ -32,8 +33,8 @@ def manhattan_dist(ptA, ptB):
     return abs(xa - xb) + abs(ya - yb)
 
 
-def calculate_heuristic(map, point):
-    return manhattan_dist(get_target_point(map), point)
+def calculate_heuristic(map, index):
+    return manhattan_dist(get_target_point(map), map.point(index))
 
 
 class AStarAlgorithm:
@@ -41,36 +42,36 @@ class AStarAlgorithm:
         self._visited_points = set()
         self._current_node = None
         self._map = map
-        self._target = get_target_point(map)
+        self._target = map.index(*get_target_point(map))
 
 
     def find_cost_of_best_path(self):
         nodes = [self._create_starting_node()]
         while not self._is_target_reached(nodes):
-            if self._current_node.coords in self._visited_points:
+            if self._current_node.index in self._visited_points:
                 continue
-            for x, y in neighbours_of_point(self._map, *self._current_node.coords):
-                if (x, y) in self._visited_points:
+            for neighbour in self._map.neighbour_indices(self._current_node.index):
+                if neighbour in self._visited_points:
                     continue
-                self._update_cost_of_neighbour((x, y), nodes)
-            self._visited_points.add(self._current_node.coords)
+                self._update_cost_of_neighbour(neighbour, nodes)
+            self._visited_points.add(self._current_node.index)
         return self._current_node.cost
     
     
     def _create_starting_node(self):
-        heuristic = calculate_heuristic(self._map, (0, 0))
-        node = Node(coords=(0, 0), value=self._map[0][0], cost=0, heuristic_val=heuristic)
+        start = self._map.index(0, 0)
+        heuristic = calculate_heuristic(self._map, start)
+        node = Node(index=start, value=self._map.cells[start], cost=0, heuristic_val=heuristic)
         return node
     
 
     def _is_target_reached(self, nodes):
         self._current_node = heapq.heappop(nodes)
-        return self._current_node.coords == self._target
+        return self._current_node.index == self._target
     
 
     def _update_cost_of_neighbour(self, neighbour, nodes):
-        x, y = neighbour
-        risk = self._map[y][x]
+        risk = self._map.cells[neighbour]
         evaluated_cost = self._current_node.cost + risk
         heapq.heappush(nodes, Node(neighbour, risk, evaluated_cost, calculate_heuristic(self._map, neighbour)))
 
@@ -79,36 +80,25 @@ def transform_risk(value):
     return value + 1 if value < 9 else 1
 
 
-def generate_adjacent_tile(entry):
-    return [[transform_risk(num) for num in row] for row in entry]
-
+# Risk tables for tiles 0 to 8 steps away from the original, applied to a whole row at once with translate.
+RISK_SHIFTS = [bytes(range(256))]
+for _ in range(2 * (TILES_PER_SIDE - 1)):
+    RISK_SHIFTS.append(bytes(transform_risk(value) if 1 <= value <= 9 else value for value in RISK_SHIFTS[-1]))
 
-def extend_maps_height(map):
-    tile = list(map)
-    for _ in range(4):
-        tile = generate_adjacent_tile(tile)
-        map += tile
 
-
-def extend_maps_width(map):
-    for row in map:
-        tile_row = list(row)
-        for _ in range(4):
-            tile_row = [transform_risk(num) for num in tile_row]
-            row += tile_row
+def extend_map(map):
+    rows = list(map.rows())
+    return grid_from_rows(b''.join(row.translate(RISK_SHIFTS[tile_y + tile_x]) for tile_x in range(TILES_PER_SIDE))
+        for tile_y in range(TILES_PER_SIDE) for row in rows)
 
 
-def extend_map(map):
-    extend_maps_height(map)
-    extend_maps_width(map)
+def parse(input):
+    return parse_risk_level_map(input)
 
 
-def resolve_part1(input):
-    risk_levels = parse_risk_level_map(input)
+def resolve_part1(risk_levels):
     return AStarAlgorithm(risk_levels).find_cost_of_best_path()
 
 
-def resolve_part2(input):
-    risk_levels = parse_risk_level_map(input)
-    extend_map(risk_levels)
-    return AStarAlgorithm(risk_levels).find_cost_of_best_path()
\ No newline at end of file
+def resolve_part2(risk_levels):
+    return AStarAlgorithm(extend_map(risk_levels)).find_cost_of_best_path()
\ No newline at end of file
@@ -118,13 +118,14 @@ def evaluate_packet(packet):
     return int(lhs == rhs)
 
 
-def resolve_part1(input):
+def parse(input):
     bits = get_transmission_bits(input[0])
-    packets = parse_transmission(iter(bits))
+    return parse_transmission(iter(bits))
+
+
+def resolve_part1(packets):
     return sum_version_numbers(packets)
 
 
-def resolve_part2(input):
-    bits = get_transmission_bits(input[0])
-    packets = parse_transmission(iter(bits))
+def resolve_part2(packets):
     return evaluate_packet(packets[0])
\ No newline at end of file
@@ -96,12 +96,14 @@ def count_velocities_combination_falling_in_target(target_area):
     return v1 + v2
 
 
-def resolve_part1(input):
-    target = parse_target_area(input)
+def parse(input):
+    return parse_target_area(input)
+
+
+def resolve_part1(target):
     n = find_highest_y_velocity_for_target(target, 1000)
     return n ** 2 - (n * (n - 1)) // 2
 
 
-def resolve_part2(input):
-    target = parse_target_area(input)
+def resolve_part2(target):
     return count_velocities_combination_falling_in_target(target)
\ No newline at end of file
@@ -168,13 +168,15 @@ def calculate_magnitude(number):
     return 3 * magnitude_of_node(number.first) + 2 * magnitude_of_node(number.second)
     
 
-def resolve_part1(input):
-    numbers = parse_snailfish_numbers(input)
+def parse(input):
+    return parse_snailfish_numbers(input)
+
+
+def resolve_part1(numbers):
     sum = functools.reduce(add, numbers)
     return calculate_magnitude(sum)
 
 
-def resolve_part2(input):
-    numbers = parse_snailfish_numbers(input)
+def resolve_part2(numbers):
     combinations_of_two = filter(lambda entry: id(entry[0]) != id(entry[1]), itertools.product(numbers, repeat=2))
     return max(calculate_magnitude(add(x, y)) for x, y in combinations_of_two)
\ No newline at end of file
@@ -4,6 +4,8 @@ from typing import NamedTuple
 from collections import deque
 from functools import reduce
 
+from progress import report_progress
+
 
 SCANNER_REGEX = r'--- scanner (\d+) ---'
 
@@ -174,6 +176,7 @@ def normalize_scanner_reports(scanner_reports):
             del scanner_reports[scanner]
             result[scanner] = entry
             reports_queue.appendleft(entry[0])
+        report_progress(scanners_normalized=len(result), scanners_total=len(result) + len(scanner_reports))
     return result
 
 
@@ -181,16 +184,18 @@ def manhattan_dist(vec1, vec2):
     return sum(abs(x - y) for x, y in zip(vec1, vec2))
 
 
+def parse(input):
+    return parse_scanner_reports(input)
+
+
 # both parts take some time on real input
-def resolve_part1(input):
-    scanners = parse_scanner_reports(input)
+def resolve_part1(scanners):
     normalized = normalize_scanner_reports(scanners)
     reports = (entry[0] for entry in normalized.values())
     return len(reduce(lambda s1, s2: s1 | s2, reports, set()))
 
 
-def resolve_part2(input):
-    scanners = parse_scanner_reports(input)
+def resolve_part2(scanners):
     normalized = normalize_scanner_reports(scanners)
     scanner_positions = [entry[1] for entry in normalized.values()]
     return max(manhattan_dist(s1, s2) for s1, s2 in itertools.combinations(scanner_positions, 2))
\ No newline at end of file
@@ -1,51 +1,89 @@
-class PositionResolverA:
-    def __init__(self):
-        self.x = 0
-        self.y = 0
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate, islice
+from operator import mul
+import os
+from typing import NamedTuple
 
 
-    def forward(self, units):
-        self.x += units
-    
+FORWARD_WEIGHTS = {'forward': 1, 'down': 0, 'up': 0}
+AIM_WEIGHTS = {'forward': 0, 'down': 1, 'up': -1}
+LINES_PER_BATCH = 1 << 16
+BYTES_PER_CHUNK = 1 << 26
 
-    def down(self, units):
-        self.y += units
-    
 
-    def up(self, units):
-        self.y -= units
+class CourseTransform(NamedTuple):
+    # Effect on (x, depth, aim): x + dx, depth + dy + aim * dx and aim + daim.
+    dx: int = 0
+    dy: int = 0
+    daim: int = 0
 
 
-class PositionResolverB:
-    def __init__(self):
-        self.x = 0
-        self.y = 0
-        self.aim = 0
-    
+def compose(first, second):
+    return CourseTransform(first.dx + second.dx, first.dy + second.dy + first.daim * second.dx, first.daim + second.daim)
 
-    def forward(self, units):
-        self.x += units
-        self.y += self.aim * units
-    
 
-    def down(self, units):
-        self.aim += units
-    
+def transform_batch(course):
+    tokens = ' '.join(course).split()
+    commands, units = tokens[0::2], tokens[1::2]
+    # Courses repeat a handful of distances, so each distinct one is converted once.
+    units = list(map({token: int(token) for token in set(units)}.__getitem__, units))
+    forward = list(map(mul, map(FORWARD_WEIGHTS.__getitem__, commands), units))
+    aims = list(accumulate(map(mul, map(AIM_WEIGHTS.__getitem__, commands), units)))
+    return CourseTransform(sum(forward), sum(map(mul, forward, aims)), aims[-1] if aims else 0)
 
-    def up(self, units):
-        self.aim -= units
 
+def transform_course(course):
+    course = iter(course)
+    batches = iter(lambda: list(islice(course, LINES_PER_BATCH)), [])
+    return reduce(compose, map(transform_batch, batches), CourseTransform())
 
-def go(course, resolver):
-    for line in course:
-        command, units = line.split()
-        getattr(resolver, command)(int(units))
-    return resolver.x * resolver.y
 
+def transform_course_range(path, start, end):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return transform_course(file.read(end - start).decode().splitlines())
 
-def resolve_part1(input):
-    return go(input, PositionResolverA())
 
+def chunk_boundaries(path, chunk_size):
+    boundaries = [0]
+    with open(path, 'rb') as file:
+        size = file.seek(0, os.SEEK_END)
+        while boundaries[-1] < size:
+            file.seek(min(boundaries[-1] + chunk_size, size))
+            file.readline()
+            boundaries.append(min(file.tell(), size))
+    return boundaries
 
-def resolve_part2(input):
-    return go(input, PositionResolverB())
\ No newline at end of file
+
+def transform_course_file(path, workers=None, chunk_size=BYTES_PER_CHUNK):
+    boundaries = chunk_boundaries(path, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        transforms = executor.map(transform_course_range, [path] * (len(boundaries) - 1), boundaries, boundaries[1:])
+        return reduce(compose, transforms, CourseTransform())
+
+
+def final_position_part1(transform):
+    # Without aim, down and up change the depth directly, which is what aim tracks.
+    return transform.dx * transform.daim
+
+
+def final_position_part2(transform):
+    return transform.dx * transform.dy
+
+
+def resolve_part1(course):
+    return final_position_part1(transform_course(course))
+
+
+def resolve_part2(course):
+    return final_position_part2(transform_course(course))
+
+
+# Defined only so the runner streams the course instead of falling back to the memory-mapped view.
+def resolve_part1_stream(input):
+    return resolve_part1(input)
+
+
+def resolve_part2_stream(input):
+    return resolve_part2(input)
@@ -81,11 +81,15 @@ def repeat_enhancement(enhancement_algo, image, iterations):
     return image
 
 
-def resolve_part1(input):
-    algo, pixels = parse_input(input)
+def parse(input):
+    return parse_input(input)
+
+
+def resolve_part1(puzzle):
+    algo, pixels = puzzle
     return repeat_enhancement(algo, InfiniteImage(pixels, is_lit_pixels_map=True), iterations=2).lit_pixels_count()
 
 
-def resolve_part2(input):
-    algo, pixels = parse_input(input)
+def resolve_part2(puzzle):
+    algo, pixels = puzzle
     return repeat_enhancement(algo, InfiniteImage(pixels, is_lit_pixels_map=True), iterations=50).lit_pixels_count()
\ No newline at end of file
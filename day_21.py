@@ -95,11 +95,15 @@ def calculate_winning_combinations(game_state, state_cache):
     return (p1_wins, p2_wins)
 
 
-def resolve_part1(input):
-    return play(parse_positions(input))
+def parse(input):
+    return parse_positions(input)
 
 
-def resolve_part2(input):
-    pos1, pos2 = parse_positions(input)
+def resolve_part1(positions):
+    return play(positions)
+
+
+def resolve_part2(positions):
+    pos1, pos2 = positions
     starting_state = GameState(players=(PlayerInfo(pos1, score=0), PlayerInfo(pos2, score=0)), current_player=0)
     return max(calculate_winning_combinations(starting_state, state_cache={}))
\ No newline at end of file
@@ -121,10 +121,13 @@ def run_reboot(steps):
     return turned_on
 
 
-def resolve_part1(input):
-    return len(run_initialization(parse_reboot_steps(input)))
+def parse(input):
+    return parse_reboot_steps(input)
 
 
-def resolve_part2(input):
-    steps = parse_reboot_steps(input)
+def resolve_part1(steps):
+    return len(run_initialization(steps))
+
+
+def resolve_part2(steps):
     return run_reboot(steps)
\ No newline at end of file
@@ -2,6 +2,8 @@ from typing import List, NamedTuple, Union
 from itertools import dropwhile, combinations, starmap, chain, filterfalse
 import heapq
 
+from progress import is_listening, report_progress
+
 
 def parse_amphipods_positions(input):
     def amphipods():
@@ -252,6 +254,7 @@ class AStarAlgorithm:
 
     def run(self, starting_diagram):
         nodes = [self._create_node(starting_diagram, energy_used=0)]
+        report = is_listening()
         while not self._is_target_reached(nodes):
             if self._current_node.diagram in self._visited_diagrams:
                 continue
@@ -260,6 +263,8 @@ class AStarAlgorithm:
                     continue
                 heapq.heappush(nodes, self._create_node(diagram, self._current_node.energy_used + cost))
             self._visited_diagrams.add(self._current_node.diagram)
+            if report:
+                report_progress(nodes_expanded=len(self._visited_diagrams), energy_used=self._current_node.energy_used)
         return self._current_node.energy_used
 
 
@@ -272,11 +277,15 @@ class AStarAlgorithm:
         return Node(diagram, energy_used, heuristic=diagram.calculate_reorganization_heuristic())
 
 
-def resolve_part1(input):
-    diagram = AmphipodsDiagram(parse_amphipods_positions(input), sideroom_depth=2)
+def parse(input):
+    return parse_amphipods_positions(input)
+
+
+def resolve_part1(amphipod_positions):
+    diagram = AmphipodsDiagram(amphipod_positions, sideroom_depth=2)
     return AStarAlgorithm().run(diagram)
 
 
-def resolve_part2(input):
-    diagram = AmphipodsDiagram(unfold(parse_amphipods_positions(input)), sideroom_depth=4)
+def resolve_part2(amphipod_positions):
+    diagram = AmphipodsDiagram(unfold(amphipod_positions), sideroom_depth=4)
     return AStarAlgorithm().run(diagram)
\ No newline at end of file
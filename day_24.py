@@ -86,9 +86,13 @@ def find_lowest_serial_number(monad):
     return convert_to_serial_number(digits_stack)
 
 
-def resolve_part1(input):
-    return find_highest_serial_number(parse_monad_processors(input))
+def parse(input):
+    return parse_monad_processors(input)
 
 
-def resolve_part2(input):
-    return find_lowest_serial_number(parse_monad_processors(input))
\ No newline at end of file
+def resolve_part1(processors):
+    return find_highest_serial_number(processors)
+
+
+def resolve_part2(processors):
+    return find_lowest_serial_number(processors)
\ No newline at end of file
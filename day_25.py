@@ -78,8 +78,12 @@ def find_first_step_of_cucumbers_stalemate(cucumbers_map: CucumbersMap):
             return i
 
 
-def resolve_part1(input):
-    return find_first_step_of_cucumbers_stalemate(parse_cucumbers_map(input))
+def parse(input):
+    return parse_cucumbers_map(input)
+
+
+def resolve_part1(cucumbers_map):
+    return find_first_step_of_cucumbers_stalemate(cucumbers_map)
 
 
 def resolve_part2(_):
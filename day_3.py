@@ -1,62 +1,74 @@
-def determine_most_common_bit(report, bit_index):
-    bit_counts = {'0': 0, '1': 0}
-    for number in report:
-        bit_counts[number[bit_index]] += 1
-    zeros, ones = bit_counts['0'], bit_counts['1']
-    if zeros > ones:
-        return '0'
-    if ones > zeros:
-        return '1'
-    return None
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import partial
+import sys
+from typing import NamedTuple
 
 
-def reverse_bit(bit):
-    return '1' if bit == '0' else '0'
+class DiagnosticReport(NamedTuple):
+    numbers: array
+    bits_count: int
+
+
+def parse(input):
+    numbers = sorted(map(partial(int, base=2), input))
+    return DiagnosticReport(array('Q', numbers), len(input[0]))
+
+
+def count_ones_per_bit(numbers, bits_count):
+    # Least significant bit first, from a histogram of each byte column.
+    raw, width = numbers.tobytes(), numbers.itemsize
+    ones = [0] * bits_count
+    for byte_idx in range((bits_count + 7) // 8):
+        offset = byte_idx if sys.byteorder == 'little' else width - 1 - byte_idx
+        for value, count in Counter(raw[offset::width]).items():
+            for bit in range(8):
+                if value >> bit & 1:
+                    ones[8 * byte_idx + bit] += count
+    return ones
 
 
 def get_gamma_epsilon_rates(report):
-    gamma_bits = []
-    epsilon_bits = []
-    bits_count = len(report[0])
-    for bit_idx in range(bits_count):
-        most_common = determine_most_common_bit(report, bit_idx)
-        gamma_bits.append(most_common)
-        epsilon_bits.append(reverse_bit(most_common))
-    gamma, epsilon = (int(''.join(bits), 2) for bits in (gamma_bits, epsilon_bits))
+    numbers, bits_count = report
+    gamma = 0
+    for ones in reversed(count_ones_per_bit(numbers, bits_count)):
+        gamma = gamma << 1 | (ones > len(numbers) - ones)
+    epsilon = gamma ^ ((1 << bits_count) - 1)
     return (gamma, epsilon)
 
 
-class ReportFilterWithBitCriteria:
-    def __init__(self, report, bit_criteria_func):
-        self._report = list(report)
-        self._bit_criteria_func = bit_criteria_func
-    
-
-    def get(self):
-        step = 0
-        while len(self._report) > 1:
-            match_bit = self._bit_criteria_func(self._report, step)
-            self._report = list(filter(lambda num: num[step] == match_bit, self._report))
-            step += 1
-        return int(''.join(self._report[0]), 2)
+def find_rating(report, keep_ones):
+    # Numbers sharing a prefix are a contiguous range, split on the next bit by bisection.
+    numbers, bits_count = report
+    low, high = 0, len(numbers)
+    for shift in reversed(range(bits_count)):
+        if high - low == 1:
+            break
+        prefix = numbers[low] >> (shift + 1) << (shift + 1)
+        split = bisect_left(numbers, prefix | 1 << shift, low, high)
+        zeros, ones = split - low, high - split
+        if keep_ones(zeros, ones):
+            low = split
+        else:
+            high = split
+    return numbers[low]
 
 
-def determine_oxygen_generator_rating_bit(report, bit_index):
-    most_common = determine_most_common_bit(report, bit_index)
-    return most_common if most_common is not None else '1'
+def keeps_oxygen_generator_ones(zeros, ones):
+    return ones >= zeros
 
 
-def determine_co2_scrubber_rating_bit(report, bit_index):
-    most_common = determine_most_common_bit(report, bit_index)
-    return reverse_bit(most_common) if most_common is not None else '0'
+def keeps_co2_scrubber_ones(zeros, ones):
+    return zeros == 0 or 0 < ones < zeros
 
 
-def resolve_part1(input):
-    gamma, epsilon = get_gamma_epsilon_rates(input)
+def resolve_part1(report):
+    gamma, epsilon = get_gamma_epsilon_rates(report)
     return gamma * epsilon
 
 
-def resolve_part2(input):
-    oxygen_rating = ReportFilterWithBitCriteria(input, determine_oxygen_generator_rating_bit).get()
-    co2_rating = ReportFilterWithBitCriteria(input, determine_co2_scrubber_rating_bit).get()
-    return oxygen_rating * co2_rating
\ No newline at end of file
+def resolve_part2(report):
+    oxygen_rating = find_rating(report, keeps_oxygen_generator_ones)
+    co2_rating = find_rating(report, keeps_co2_scrubber_ones)
+    return oxygen_rating * co2_rating
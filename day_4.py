@@ -1,118 +1,149 @@
-from dataclasses import dataclass
+from array import array
+from collections import defaultdict
+from typing import NamedTuple
 
 
-@dataclass
-class BoardField:
-    value: int
-    is_marked: bool
+BOARD_SIZE = 5
+BOARD_FIELDS = BOARD_SIZE * BOARD_SIZE
 
 
-def board_lines(input):
-    board_start = 2
-    while board_start < len(input):
-        yield input[board_start:board_start+5]
-        board_start += 6
+class BoardWin(NamedTuple):
+    board: int
+    turn: int
+    last_called: int
+    score: int
 
 
-def parse_board(board_lines):
-    return [[BoardField(value=int(num), is_marked=False) for num in line.split()] for line in board_lines]
+class BingoGame:
+    # Boards are flattened row by row, BOARD_FIELDS values per board.
+    def __init__(self, numbers, fields):
+        self.numbers = numbers
+        self.fields = fields
+        self._wins = None
+        self._win_turns = None
 
 
-def parse_input(input):
-    drawed_numbers = [int(num) for num in input[0].split(',')]
-    boards = [parse_board(board) for board in board_lines(input)]
-    return (drawed_numbers, boards)
+    @property
+    def boards_count(self):
+        return len(self.fields) // BOARD_FIELDS
 
 
-def rows(board):
-    yield from board
+    def board(self, board_idx):
+        start = board_idx * BOARD_FIELDS
+        return [list(self.fields[row:row + BOARD_SIZE]) for row in range(start, start + BOARD_FIELDS, BOARD_SIZE)]
 
 
-def columns(board):
-    yield from ([row[idx] for row in board] for idx in range(5))
+    def wins(self):
+        # Boards completed by the same number follow their input order.
+        if self._wins is None:
+            self._wins = play(self.numbers, self.fields)
+        return self._wins
 
 
-def enumerate_board_numbers(board):
-    for row in rows(board):
-        yield from row
+    def winner(self, k):
+        return self.wins()[k]
 
 
-def is_winning_board(board):
-    def is_any_row_marked():
-        return any(all(field.is_marked for field in row) for row in rows(board))
-    def is_any_column_marked():
-        return any(all(field.is_marked for field in column) for column in columns(board))
-    return is_any_row_marked() or is_any_column_marked()
+    def win_turns(self):
+        # Boards that never win get len(numbers).
+        if self._win_turns is None:
+            self._win_turns = rank_win_turns(self.numbers, self.fields)
+        return self._win_turns
 
 
-def find_winner(boards):
-    return next(filter(is_winning_board, boards), None)
+    def board_win(self, board_idx):
+        turn = self.win_turns()[board_idx]
+        start = board_idx * BOARD_FIELDS
+        board = self.fields[start:start + BOARD_FIELDS]
+        unmarked = sum(number for number, rank in zip(board, draw_ranks(self.numbers, board)) if rank > turn)
+        return BoardWin(board_idx, turn, self.numbers[turn], unmarked * self.numbers[turn])
 
 
-def mark_number(boards, number):
-    for board in boards:
-        to_be_marked = next(filter(lambda field: field.value == number, enumerate_board_numbers(board)), None)
-        if to_be_marked is not None:
-            to_be_marked.is_marked = True
+def parse_input(input):
+    drawed_numbers = array('i', map(int, input[0].split(',')))
+    fields = array('i', map(int, ' '.join(input[2:]).split()))
+    return BingoGame(drawed_numbers, fields)
+
+
+def index_fields(fields):
+    positions_by_number = defaultdict(list)
+    for position, number in enumerate(fields):
+        positions_by_number[number].append(position)
+    return positions_by_number
+
+
+def play(numbers, fields):
+    boards_count = len(fields) // BOARD_FIELDS
+    unmarked_sums = array('q', (sum(fields[start:start + BOARD_FIELDS]) for start in range(0, len(fields), BOARD_FIELDS)))
+    row_hits = bytearray(boards_count * BOARD_SIZE)
+    column_hits = bytearray(boards_count * BOARD_SIZE)
+    has_won = bytearray(boards_count)
+    positions_by_number = index_fields(fields)
+    wins = []
+    for turn, number in enumerate(numbers):
+        for position in positions_by_number.pop(number, ()):
+            # Rows are stored consecutively, so the row counter index is just the row's index across all boards.
+            row_idx = position // BOARD_SIZE
+            board_idx = row_idx // BOARD_SIZE
+            if has_won[board_idx]:
+                continue
+            unmarked_sums[board_idx] -= number
+            column_idx = board_idx * BOARD_SIZE + position % BOARD_SIZE
+            row_hits[row_idx] += 1
+            column_hits[column_idx] += 1
+            if row_hits[row_idx] == BOARD_SIZE or column_hits[column_idx] == BOARD_SIZE:
+                has_won[board_idx] = 1
+                wins.append(BoardWin(board_idx, turn, number, unmarked_sums[board_idx] * number))
+        if len(wins) == boards_count:
+            break
+    return wins
+
+
+def draw_ranks(numbers, fields):
+    never_drawn = len(numbers)
+    rank_by_number = [never_drawn] * (max(max(numbers), max(fields)) + 1)
+    for rank in reversed(range(len(numbers))):
+        rank_by_number[numbers[rank]] = rank
+    return array('i', map(rank_by_number.__getitem__, fields))
+
+
+def rank_win_turns(numbers, fields):
+    # A line completes on its latest draw and a board on its earliest line.
+    ranks = draw_ranks(numbers, fields)
+    row_turns = list(map(max, *(ranks[col::BOARD_SIZE] for col in range(BOARD_SIZE))))
+    board_row_turns = map(min, *(row_turns[row::BOARD_SIZE] for row in range(BOARD_SIZE)))
+    column_turns = (map(max, *(ranks[row * BOARD_SIZE + col::BOARD_FIELDS] for row in range(BOARD_SIZE)))
+        for col in range(BOARD_SIZE))
+    board_column_turns = map(min, *column_turns)
+    return array('i', map(min, board_row_turns, board_column_turns))
 
 
 class WinningBingoBoardSeeker:
-    def __init__(self):
-        self.winner = None
-        self.last_called = None
-    
-
-    def find(self, boards, numbers):
-        drawing = iter(numbers)
-        while not self.is_any_board_winning(boards):
-            self.last_called = next(drawing)
-            mark_number(boards, self.last_called)
-        return self.winner
-    
-
-    def is_any_board_winning(self, boards):
-        self.winner = find_winner(boards)
-        return self.winner is not None
+    def find(self, bingo_game):
+        win_turns = bingo_game.win_turns()
+        return bingo_game.board_win(min(range(len(win_turns)), key=win_turns.__getitem__))
 
 
 class LosingBingoBoardSeeker:
-    def __init__(self):
-        self.last_called = None
-    
-
-    def find(self, boards, numbers):
-        drawing = iter(numbers)
-        while not self.is_only_single_board_left(boards):
-            self.last_called = next(drawing)
-            mark_number(boards, self.last_called)
-            boards = list(filter(lambda board: not is_winning_board(board), boards))
-        loser_board = boards[0]
-        while not is_winning_board(loser_board):
-            self.last_called = next(drawing)
-            mark_number(boards, self.last_called)
-        return loser_board
-    
-
-    def is_only_single_board_left(self, boards):
-        return len(boards) == 1
+    def find(self, bingo_game):
+        win_turns = bingo_game.win_turns()
+        # Scanning backwards makes the last board in input order win ties, as in BingoGame.wins.
+        boards = reversed(range(len(win_turns)))
+        winning = filter(lambda board_idx: win_turns[board_idx] < len(bingo_game.numbers), boards)
+        return bingo_game.board_win(max(winning, key=win_turns.__getitem__))
 
 
-def calculate_score(board, last_called):
-    def is_unmarked(field):
-        return not field.is_marked
-    unmarked = sum(field.value for field in filter(is_unmarked, enumerate_board_numbers(board)))
-    return unmarked * last_called
+def solve_bingo_puzzle(bingo_game, bingo_seeker):
+    return bingo_seeker.find(bingo_game).score
 
 
-def solve_bingo_puzzle(input, bingo_seeker):
-    numbers, boards = parse_input(input)
-    board_of_interest = bingo_seeker.find(boards, numbers)
-    return calculate_score(board_of_interest, bingo_seeker.last_called)
+def parse(input):
+    return parse_input(input)
 
 
-def resolve_part1(input):
-    return solve_bingo_puzzle(input, WinningBingoBoardSeeker())
+def resolve_part1(bingo_game):
+    return solve_bingo_puzzle(bingo_game, WinningBingoBoardSeeker())
 
 
-def resolve_part2(input):
-    return solve_bingo_puzzle(input, LosingBingoBoardSeeker())
\ No newline at end of file
+def resolve_part2(bingo_game):
+    return solve_bingo_puzzle(bingo_game, LosingBingoBoardSeeker())
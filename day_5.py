@@ -1,6 +1,8 @@
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 import re
-from itertools import repeat
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from itertools import chain, combinations
 
 
 class Point(NamedTuple):
@@ -34,39 +36,199 @@ def filter_horizontal_and_vertical_lines(lines):
     return filter(lambda line: is_vertical(line) or is_horizontal(line), lines)
 
 
-def enumerate_points(line):
-    def closed_interval(begin, end):
-        if begin <= end:
-            return range(begin, end + 1)
-        return range(begin, end - 1, -1)
-    if is_horizontal(line):
-        return zip(closed_interval(line.begin.x, line.end.x), repeat(line.begin.y))
-    if is_vertical(line):
-        return zip(repeat(line.begin.x), closed_interval(line.begin.y, line.end.y))
-    return zip(closed_interval(line.begin.x, line.end.x), closed_interval(line.begin.y, line.end.y))
+class PlaneBounds(NamedTuple):
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+DENSE_GRID_MAX_CELLS = 1 << 27
+DENSE_GRID_MAX_CELLS_PER_POINT = 64
+SPARSE_MAX_POINTS = 1 << 24
+# Counts saturate at 2 because only points covered more than once matter.
+SATURATING_INCREMENT = bytes([1, 2] + [2] * 254)
+
+
+def find_bounds(lines):
+    xs = [coord for line in lines for coord in (line.begin.x, line.end.x)]
+    ys = [coord for line in lines for coord in (line.begin.y, line.end.y)]
+    left, top = min(xs, default=0), min(ys, default=0)
+    return PlaneBounds(left, top, max(xs, default=0) - left + 1, max(ys, default=0) - top + 1)
 
 
-def mark_line_on_plane(plane, line):
-    for x, y in enumerate_points(line):
-        plane[(x, y)] = plane.get((x, y), 0) + 1
+def line_length(line):
+    return max(abs(line.end.x - line.begin.x), abs(line.end.y - line.begin.y)) + 1
 
 
-def build_vent_lines_map(lines):
-    plane = {}
+def flat_range(line, bounds):
+    # A range with step 1, width or width +/- 1.
+    def flat_index(point):
+        return (point.y - bounds.top) * bounds.width + point.x - bounds.left
+    begin, end = sorted((flat_index(line.begin), flat_index(line.end)))
+    if begin == end:
+        return range(begin, begin + 1)
+    step = (end - begin) // (line_length(line) - 1)
+    return range(begin, end + 1, step)
+
+
+def count_overlaps_dense(lines, bounds):
+    plane = bytearray(bounds.width * bounds.height)
     for line in lines:
-        mark_line_on_plane(plane, line)
-    return plane
+        points = flat_range(line, bounds)
+        cells = slice(points.start, points.stop, points.step)
+        plane[cells] = plane[cells].translate(SATURATING_INCREMENT)
+    return len(plane) - plane.count(0) - plane.count(1)
+
+
+def count_overlaps_sparse(lines, bounds):
+    plane = Counter(chain.from_iterable(flat_range(line, bounds) for line in lines))
+    return len(plane) - list(plane.values()).count(1)
+
+
+class Orientation(NamedTuple):
+    # The key is constant along a line and the parameter moves one step per point.
+    key: Callable[[int, int], int]
+    parameter: Callable[[int, int], int]
+    point: Callable[[int, int], Point]
+
+
+ORIENTATIONS = {
+    'horizontal': Orientation(lambda x, y: y, lambda x, y: x, lambda key, t: Point(t, key)),
+    'vertical': Orientation(lambda x, y: x, lambda x, y: y, lambda key, t: Point(key, t)),
+    'diagonal': Orientation(lambda x, y: x - y, lambda x, y: x, lambda key, t: Point(t, t - key)),
+    'antidiagonal': Orientation(lambda x, y: x + y, lambda x, y: x, lambda key, t: Point(t, key - t)),
+}
+
+
+class Run(NamedTuple):
+    key: int
+    start: int
+    end: int
+
+
+def classify(line):
+    if is_horizontal(line):
+        return 'horizontal'
+    if is_vertical(line):
+        return 'vertical'
+    if (line.end.x - line.begin.x) * (line.end.y - line.begin.y) > 0:
+        return 'diagonal'
+    return 'antidiagonal'
+
+
+def merge_runs(runs):
+    # Points covered at least once and points covered at least twice.
+    events = sorted(chain.from_iterable(((run.key, run.start, 1), (run.key, run.end + 1, -1)) for run in runs))
+    covered, overlapped = [], []
+    coverage = 0
+    for idx, (key, position, change) in enumerate(events):
+        coverage += change
+        next_key, next_position, _ = events[idx + 1] if idx + 1 < len(events) else (None, None, None)
+        if next_key != key or next_position == position:
+            continue
+        if coverage >= 1:
+            covered.append(Run(key, position, next_position - 1))
+        if coverage >= 2:
+            overlapped.append(Run(key, position, next_position - 1))
+    return covered, overlapped
+
+
+INSERT, QUERY, REMOVE = range(3)
+
+
+def sweep_crossings(first, first_runs, second, second_runs, to_second_key, to_first_key, step):
+    # Runs of two orientations are orthogonal segments in the (second key, first key) plane.
+    events = []
+    for run in first_runs:
+        low, high = sorted((to_second_key(run.key, run.start), to_second_key(run.key, run.end)))
+        events.extend(((low, INSERT, run.key), (high, REMOVE, run.key)))
+    for run in second_runs:
+        low, high = sorted((to_first_key(run.key, run.start), to_first_key(run.key, run.end)))
+        events.append((run.key, QUERY, low, high))
+    events.sort()
+    active = []
+    for second_key, kind, *first_keys in events:
+        if kind == INSERT:
+            insort(active, first_keys[0])
+        elif kind == REMOVE:
+            del active[bisect_left(active, first_keys[0])]
+        else:
+            low, high = first_keys
+            for first_key in active[bisect_left(active, low):bisect_right(active, high)]:
+                offset = second_key - to_second_key(first_key, 0)
+                if offset % step == 0:
+                    yield first.point(first_key, offset // step)
+
+
+def find_crossings(first, first_runs, second, second_runs):
+    def to_second_key(first_key, t):
+        return second.key(*first.point(first_key, t))
+    def to_first_key(second_key, t):
+        return first.key(*second.point(second_key, t))
+    step = to_second_key(0, 1) - to_second_key(0, 0)
+    if abs(step) == 1:
+        return sweep_crossings(first, first_runs, second, second_runs, to_second_key, to_first_key, step)
+    # Diagonals of opposite directions meet on a lattice point only when their keys have the same parity.
+    return chain.from_iterable(sweep_crossings(first, [run for run in first_runs if run.key % 2 == parity], second,
+        [run for run in second_runs if run.key % 2 == parity], to_second_key, to_first_key, step) for parity in (0, 1))
+
+
+def is_in_runs(runs_by_key, key, parameter):
+    starts, ends = runs_by_key.get(key, ((), ()))
+    idx = bisect_right(starts, parameter) - 1
+    return idx >= 0 and parameter <= ends[idx]
+
+
+def count_overlaps_sweep(lines, bounds=None):
+    # Overlaps within an orientation plus crossings between orientations, each point once.
+    runs = {}
+    for line in lines:
+        name = classify(line)
+        orientation = ORIENTATIONS[name]
+        start, end = sorted(orientation.parameter(*point) for point in line)
+        runs.setdefault(name, []).append(Run(orientation.key(*line.begin), start, end))
+    merged = {name: merge_runs(orientation_runs) for name, orientation_runs in runs.items()}
+    crossings = set()
+    for first, second in combinations(merged, 2):
+        crossings.update(find_crossings(ORIENTATIONS[first], merged[first][0], ORIENTATIONS[second], merged[second][0]))
+    overlapped_points = 0
+    for name, (_, overlapped) in merged.items():
+        overlapped_points += sum(run.end - run.start + 1 for run in overlapped)
+        runs_by_key = {}
+        for run in overlapped:
+            starts, ends = runs_by_key.setdefault(run.key, ([], []))
+            starts.append(run.start)
+            ends.append(run.end)
+        orientation = ORIENTATIONS[name]
+        overlapped_points -= sum(1 for point in crossings
+            if is_in_runs(runs_by_key, orientation.key(*point), orientation.parameter(*point)))
+    return len(crossings) + overlapped_points
+
+
+def choose_overlaps_counter(lines, bounds):
+    cells = bounds.width * bounds.height
+    points = sum(map(line_length, lines))
+    if cells <= DENSE_GRID_MAX_CELLS and cells <= DENSE_GRID_MAX_CELLS_PER_POINT * points:
+        return count_overlaps_dense
+    if points <= SPARSE_MAX_POINTS:
+        return count_overlaps_sparse
+    return count_overlaps_sweep
 
 
 def calculate_overlapping_points_count(lines):
-    vent_lines_overlap = build_vent_lines_map(lines)
-    return sum(1 for _, overlap in vent_lines_overlap.items() if overlap > 1)
+    lines = list(lines)
+    bounds = find_bounds(lines)
+    return choose_overlaps_counter(lines, bounds)(lines, bounds)
+
+
+def parse(input):
+    return parse_lines(input)
 
 
-def resolve_part1(input):
-    vent_lines = parse_lines(input)
+def resolve_part1(vent_lines):
     return calculate_overlapping_points_count(filter_horizontal_and_vertical_lines(vent_lines))
 
 
-def resolve_part2(input):
-    return calculate_overlapping_points_count(parse_lines(input))
\ No newline at end of file
+def resolve_part2(vent_lines):
+    return calculate_overlapping_points_count(vent_lines)
\ No newline at end of file
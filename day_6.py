@@ -1,32 +1,89 @@
 from itertools import repeat
-from collections import deque
+
+
+TIMER_STATES = 9
+RESET_TIMER = 6
 
 
 def parse_initial_state(lines):
-    init = deque(repeat(0, times=9))
+    init = list(repeat(0, times=TIMER_STATES))
     for fish in [int(num) for num in lines[0].split(',')]:
         init[fish] += 1
     return init
 
 
-def simulate_single_day(current):
-    reproducing_fish_count = current.popleft()
-    current[6] += reproducing_fish_count
-    current.append(reproducing_fish_count)
+def build_transition_matrix():
+    # Row i says which timers of today end up with timer i tomorrow.
+    matrix = [[0] * TIMER_STATES for _ in range(TIMER_STATES)]
+    for timer in range(1, TIMER_STATES):
+        matrix[timer - 1][timer] = 1
+    matrix[RESET_TIMER][0] = 1
+    matrix[TIMER_STATES - 1][0] = 1
+    return matrix
+
+
+def reduce_modulo(values, modulus):
+    return values if modulus is None else [value % modulus for value in values]
+
+
+def multiply_matrices(first, second, modulus=None):
+    columns = list(zip(*second))
+    return [reduce_modulo([sum(map(int.__mul__, row, column)) for column in columns], modulus) for row in first]
+
+
+def apply_matrix(matrix, state, modulus=None):
+    return reduce_modulo([sum(map(int.__mul__, row, state)) for row in matrix], modulus)
+
+
+class TransitionPowers:
+    def __init__(self, modulus=None):
+        self.modulus = modulus
+        self._squarings = [build_transition_matrix()]
+        self._by_days = {}
 
 
-def simulate_lanternfish_population_growth(initial_state, days):
-    current_state = deque(initial_state)
-    for _ in range(days):
-        simulate_single_day(current_state)
-    return current_state
+    def power(self, days):
+        if days not in self._by_days:
+            while len(self._squarings) < days.bit_length():
+                self._squarings.append(multiply_matrices(self._squarings[-1], self._squarings[-1], self.modulus))
+            result = None
+            for bit, squaring in enumerate(self._squarings[:days.bit_length()]):
+                if days >> bit & 1:
+                    result = squaring if result is None else multiply_matrices(result, squaring, self.modulus)
+            self._by_days[days] = result
+        return self._by_days[days]
 
 
-def resolve_part1(input):
-    population = simulate_lanternfish_population_growth(parse_initial_state(input), days=80)
+    def advance(self, state, days):
+        if days == 0:
+            return reduce_modulo(list(state), self.modulus)
+        return apply_matrix(self.power(days), state, self.modulus)
+
+
+def simulate_lanternfish_population_growth(initial_state, days, modulus=None):
+    return TransitionPowers(modulus).advance(initial_state, days)
+
+
+def simulate_lanternfish_population_at_horizons(initial_state, horizons, modulus=None):
+    # Each sorted horizon is reached from the previous one.
+    powers = TransitionPowers(modulus)
+    states = {}
+    state, day = initial_state, 0
+    for horizon in sorted(set(horizons)):
+        state, day = powers.advance(state, horizon - day), horizon
+        states[horizon] = state
+    return states
+
+
+def parse(input):
+    return parse_initial_state(input)
+
+
+def resolve_part1(initial_state):
+    population = simulate_lanternfish_population_growth(initial_state, days=80)
     return sum(population)
 
 
-def resolve_part2(input):
-    population = simulate_lanternfish_population_growth(parse_initial_state(input), days=256)
-    return sum(population)
\ No newline at end of file
+def resolve_part2(initial_state):
+    population = simulate_lanternfish_population_growth(initial_state, days=256)
+    return sum(population)
@@ -1,52 +1,128 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, repeat
+from math import comb
+from operator import mul, sub
+
+from selection import introselect
+
+
 def parse_crabs_positions(input):
     return [int(pos) for pos in input[0].split(',')]
 
 
-def calculate_median(positions):
-    positions = sorted(positions)
-    if len(positions) % 2 == 1:
-        return positions[len(positions) // 2]
-    middle = len(positions) // 2
-    return (positions[middle - 1] + positions[middle]) / 2
+def read_crabs_positions(chunks):
+    positions = array('i')
+    partial_token = ''
+    for chunk in chunks:
+        tokens = (partial_token + chunk).split(',')
+        partial_token = tokens.pop()
+        positions.extend(map(int, tokens))
+    if partial_token.strip():
+        positions.append(int(partial_token))
+    return positions
+
+
+def linear_fuel_at(positions, target):
+    return sum(map(abs, map(sub, positions, repeat(target))))
+
+
+def triangular_fuel_at(positions, target):
+    def offsets():
+        return map(sub, positions, repeat(target))
+    return (linear_fuel_at(positions, target) + sum(map(mul, offsets(), offsets()))) // 2
+
+
+def find_minimal_linear_fuel_cost(positions):
+    # Any median minimizes the sum of distances.
+    return linear_fuel_at(positions, introselect(positions, (len(positions) - 1) // 2))
+
+
+def find_minimal_triangular_fuel_cost(positions):
+    # The slope of the triangular total at t is n * (t - mean) plus at most n / 2 in either direction,
+    # so its minimum lies within half a step of the mean.
+    count, total = len(positions), sum(positions)
+    lowest, highest = (2 * total - count) // (2 * count), -(-(2 * total + count) // (2 * count))
+    return min(triangular_fuel_at(positions, target) for target in range(lowest, highest + 1))
+
+
+class CrabPositions:
+    def __init__(self, positions):
+        self.positions = sorted(positions)
+        self._prefix_power_sums = {}
+
+
+    def prefix_power_sums(self, degree):
+        if degree not in self._prefix_power_sums:
+            powers = map(pow, self.positions, repeat(degree))
+            self._prefix_power_sums[degree] = list(accumulate(powers, initial=0))
+        return self._prefix_power_sums[degree]
+
+
+    def distance_power_sum(self, target, degree):
+        # (target - position) ** degree is expanded binomially on either side of the target.
+        split = bisect_right(self.positions, target)
+        total = 0
+        for power in range(degree + 1):
+            sums = self.prefix_power_sums(power)
+            below, above = sums[split], sums[-1] - sums[split]
+            weight = comb(degree, power)
+            total += weight * target ** (degree - power) * (-1) ** power * below
+            total += weight * (-target) ** (degree - power) * above
+        return total
+
+
+class PolynomialCost:
+    # Fuel per crab is sum(coefficients[k] * distance ** k) // divisor.
+    def __init__(self, coefficients, divisor=1):
+        self.coefficients = coefficients
+        self.divisor = divisor
+
+
+    def total(self, crabs, target):
+        weighted = (coefficient * crabs.distance_power_sum(target, degree)
+            for degree, coefficient in enumerate(self.coefficients) if coefficient)
+        return sum(weighted) // self.divisor
+
+
+class CallableCost:
+    def __init__(self, fuel):
+        self.fuel = fuel
+
+
+    def total(self, crabs, target):
+        return sum(self.fuel(abs(pos - target)) for pos in crabs.positions)
 
 
-def calculate_mean(positions):
-    return sum(positions) / len(positions)
+LINEAR_COST = PolynomialCost((0, 1))
+# Moving n steps costs 1 + 2 + ... + n, which is (n + n ** 2) / 2.
+TRIANGULAR_COST = PolynomialCost((0, 1, 1), divisor=2)
 
 
-class OptimizerA:
-    @staticmethod
-    def get_candidates(positions):
-        median_approx = round(calculate_median(positions))
-        return (median_approx - 1, median_approx, median_approx + 1)
-    
+def find_minimal_fuel_cost(crabs, cost):
+    # The first target from which moving right stops paying off.
+    low, high = crabs.positions[0], crabs.positions[-1]
+    def is_rising_after(target):
+        return cost.total(crabs, target + 1) >= cost.total(crabs, target)
+    best = low + bisect_left(range(low, high), True, key=is_rising_after)
+    return cost.total(crabs, best)
 
-    @staticmethod
-    def calculate_fuel_usage(positions, candidate):
-        return sum(abs(pos - candidate) for pos in positions)
 
+def parse(input):
+    return CrabPositions(parse_crabs_positions(input))
 
-class OptimizerB:
-    @staticmethod
-    def get_candidates(positions):
-        mean_approx = round(calculate_mean(positions))
-        return (mean_approx - 1, mean_approx, mean_approx + 1)
-    
 
-    @staticmethod
-    def calculate_fuel_usage(positions, candidate):
-        def sum_of_n_numbers(n):
-            return (n * (n + 1)) // 2
-        return sum(sum_of_n_numbers(abs(pos - candidate)) for pos in positions)
+def resolve_part1(crabs):
+    return find_minimal_fuel_cost(crabs, LINEAR_COST)
 
 
-def find_minimal_fuel_cost(positions, optimizer):
-    return min(optimizer.calculate_fuel_usage(positions, candidate) for candidate in optimizer.get_candidates(positions))
+def resolve_part2(crabs):
+    return find_minimal_fuel_cost(crabs, TRIANGULAR_COST)
 
 
-def resolve_part1(input):
-    return find_minimal_fuel_cost(parse_crabs_positions(input), OptimizerA)
+def resolve_part1_stream(input):
+    return find_minimal_linear_fuel_cost(read_crabs_positions(input.chunks()))
 
 
-def resolve_part2(input):
-    return find_minimal_fuel_cost(parse_crabs_positions(input), OptimizerB)
\ No newline at end of file
+def resolve_part2_stream(input):
+    return find_minimal_triangular_fuel_cost(read_crabs_positions(input.chunks()))
@@ -1,19 +1,23 @@
-from typing import List, NamedTuple, Set
-import re
-from itertools import chain
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import chain, permutations
+from multiprocessing.shared_memory import SharedMemory
+from typing import FrozenSet, NamedTuple, Tuple
 
 
+SEGMENTS = 'abcdefg'
 DIGITS_BY_SEGMENTS = [
-    set('abcefg'),  # 0
-    set('cf'),      # 1
-    set('acdeg'),   # 2
-    set('acdfg'),   # 3
-    set('bcdf'),    # 4
-    set('abdfg'),   # 5
-    set('abdefg'),  # 6
-    set('acf'),     # 7
-    set('abcdefg'), # 8
-    set('abcdfg')   # 9
+    'abcefg',   # 0
+    'cf',       # 1
+    'acdeg',    # 2
+    'acdfg',    # 3
+    'bcdf',     # 4
+    'abdfg',    # 5
+    'abdefg',   # 6
+    'acf',      # 7
+    'abcdefg',  # 8
+    'abcdfg'    # 9
 ]
 UNIQUE_LENGTHS = (
     len(DIGITS_BY_SEGMENTS[1]),
@@ -24,117 +28,117 @@ UNIQUE_LENGTHS = (
 
 
 class Display(NamedTuple):
-    signal_patterns: List[Set[str]]
-    digits_output: List[Set[str]]
+    signal_patterns: FrozenSet[int]
+    digits_output: Tuple[int, ...]
+
+
+@cache
+def pattern_mask(pattern):
+    # Bit 0 is segment a.
+    return sum(1 << SEGMENTS.index(segment) for segment in pattern)
+
+
+DIGIT_MASKS = [pattern_mask(segments) for segments in DIGITS_BY_SEGMENTS]
 
 
 def parse_displays(input):
-    display_pattern = r'(.+) \| (.+)'
     def parse_line(line):
-        signal_patterns_str, digits_output_str = re.match(display_pattern, line).groups()
-        signal_patterns = [set(sig) for sig in signal_patterns_str.split(' ')]
-        digits_output = [set(dig) for dig in digits_output_str.split(' ')]
+        signal_patterns_str, digits_output_str = line.split(' | ')
+        signal_patterns = frozenset(map(pattern_mask, signal_patterns_str.split()))
+        digits_output = tuple(map(pattern_mask, digits_output_str.split()))
         return Display(signal_patterns, digits_output)
     return [parse_line(line) for line in input]
 
 
 def count_1_4_7_8_digits_in_output(displays):
     outputs = chain.from_iterable(display.digits_output for display in displays)
-    return sum(1 for out in outputs if len(out) in UNIQUE_LENGTHS)
-
+    return sum(1 for out in outputs if out.bit_count() in UNIQUE_LENGTHS)
 
-def is_subset_of(set, subset):
-    return len(subset - set) == 0
 
+def rewire(mask, wiring):
+    return sum(1 << wire for segment, wire in enumerate(wiring) if mask >> segment & 1)
 
-def get_patterns_with_unique_lengths(signal_patterns):
-    def find_pattern_by_length(length):
-        return next(filter(lambda pattern: len(pattern) == length, signal_patterns))
-    return tuple(find_pattern_by_length(length) for length in UNIQUE_LENGTHS)
 
+@cache
+def wirings_table():
+    # Keyed by the set of scrambled patterns, which identifies the wiring.
+    table = {}
+    for wiring in permutations(range(len(SEGMENTS))):
+        scrambled = [rewire(mask, wiring) for mask in DIGIT_MASKS]
+        table[frozenset(scrambled)] = {mask: digit for digit, mask in enumerate(scrambled)}
+    return table
 
-def get_from(set):
-    return next(iter(set))
 
+def read_number(decoder, digits):
+    number = 0
+    for digit in digits:
+        number = number * 10 + decoder[digit]
+    return number
 
-class MessyDisplayReader:
-    def __init__(self, signal_patterns):
-        self.signal_to_segment = {}
-        easy_to_recognize = get_patterns_with_unique_lengths(signal_patterns)
-        self.one, self.four, self.seven, self.eight = easy_to_recognize
-        self._resolve_signal_to_segment_mapping(signal_patterns)
-    
 
-    def _resolve_signal_to_segment_mapping(self, signal_patterns):
-        a_segment = self._get_segment_a()
-        self.signal_to_segment[a_segment] = 'a'
-        self.three = self._identify_three_pattern(signal_patterns)
-        d_segment = self._get_segment_d()
-        self.signal_to_segment[d_segment] = 'd'
-        self.signal_to_segment[self._get_segment_b(d_segment)] = 'b'
-        self.signal_to_segment[self._get_segment_g(a_segment, d_segment)] = 'g'
-        self.six = self._identify_six_pattern(signal_patterns)
-        f_segment = self._get_segment_f()
-        self.signal_to_segment[f_segment] = 'f'
-        self.signal_to_segment[self._get_segment_c(f_segment)] = 'c'
-        self.signal_to_segment[self._get_segment_e()] = 'e'
-
-
-    def _get_segment_a(self):
-        return get_from(self.seven - self.one)
-    
-    
-    def _identify_three_pattern(self, signal_patterns):
-        matching_threes_length = filter(lambda pattern: len(pattern) == len(DIGITS_BY_SEGMENTS[3]), signal_patterns)
-        return next(filter(lambda pattern: is_subset_of(set=pattern, subset=self.one), matching_threes_length))
-    
+def read_display(display):
+    return read_number(wirings_table()[display.signal_patterns], display.digits_output)
 
-    def _get_segment_d(self):
-        return get_from((self.three & self.four) - self.one)
-    
 
-    def _get_segment_b(self, d):
-        return get_from(self.four - self.one - {d})
-    
+SIGNAL_PATTERNS = len(DIGITS_BY_SEGMENTS)
+DISPLAY_MASKS = SIGNAL_PATTERNS + 4
+LINES_PER_CHUNK = 1 << 15
+# Number of 1, 4, 7 and 8 digits among the four digits of every possible output value.
+UNIQUE_DIGITS_BY_VALUE = bytes(sum(digit in '1478' for digit in f'{value:04}') for value in range(10000))
 
-    def _get_segment_g(self, a, d):
-        return get_from(self.three - self.one - {a, d})
-    
 
-    def _identify_six_pattern(self, signal_patterns):
-        matching_six_length = filter(lambda pattern: len(pattern) == len(DIGITS_BY_SEGMENTS[6]), signal_patterns)
-        return next(filter(lambda pattern: not is_subset_of(set=pattern, subset=self.one), matching_six_length))
-    
+def pack_displays(lines):
+    # Ten signal patterns followed by four output digits per display.
+    tokens = ' '.join(lines).split()
+    # Every line also has a '|' token between the patterns and the output.
+    del tokens[SIGNAL_PATTERNS::DISPLAY_MASKS + 1]
+    return bytes(map(pattern_mask, tokens))
 
-    def _get_segment_f(self):
-        return get_from(self.six & self.one)
-    
 
-    def _get_segment_c(self, f):
-        return get_from(self.one - {f})
+def decode_packed_displays(packed):
+    table = wirings_table()
+    for start in range(0, len(packed), DISPLAY_MASKS):
+        decoder = table[frozenset(packed[start:start + SIGNAL_PATTERNS])]
+        yield read_number(decoder, packed[start + SIGNAL_PATTERNS:start + DISPLAY_MASKS])
 
 
-    def _get_segment_e(self):
-        return get_from(self.eight - set(self.signal_to_segment.keys()))
-    
+def decode_chunk_into(shared_name, first_display, lines):
+    shared = SharedMemory(name=shared_name)
+    try:
+        decoded = array('I', decode_packed_displays(pack_displays(lines)))
+        values = shared.buf.cast('I')
+        values[first_display:first_display + len(decoded)] = decoded
+        values.release()
+    finally:
+        shared.close()
 
-    def read_number(self, digits):
-        return int(''.join(str(self._digit_output_to_actual_digit(digit)) for digit in digits))
-    
 
-    def _digit_output_to_actual_digit(self, digit_output):
-        actual_segments = {self.signal_to_segment[d] for d in digit_output}
-        return DIGITS_BY_SEGMENTS.index(actual_segments)
+def decode_displays_batch(lines, workers=None, lines_per_chunk=LINES_PER_CHUNK):
+    # Workers write output values straight into shared memory.
+    count = len(lines)
+    shared = SharedMemory(create=True, size=max(count, 1) * array('I').itemsize)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=wirings_table) as executor:
+            chunks = [executor.submit(decode_chunk_into, shared.name, start, lines[start:start + lines_per_chunk])
+                for start in range(0, count, lines_per_chunk)]
+            for chunk in chunks:
+                chunk.result()
+        values = shared.buf.cast('I')[:count]
+        totals = (sum(map(UNIQUE_DIGITS_BY_VALUE.__getitem__, values)), sum(values))
+        values.release()
+        return totals
+    finally:
+        shared.close()
+        shared.unlink()
 
 
-def read_display(display):
-    return MessyDisplayReader(display.signal_patterns).read_number(display.digits_output)
+def parse(input):
+    return parse_displays(input)
 
 
-def resolve_part1(input):
-    return count_1_4_7_8_digits_in_output(parse_displays(input))
+def resolve_part1(displays):
+    return count_1_4_7_8_digits_in_output(displays)
 
 
-def resolve_part2(input):
-    displays = parse_displays(input)
-    return sum(read_display(display) for display in displays)
\ No newline at end of file
+def resolve_part2(displays):
+    return sum(read_display(display) for display in displays)
@@ -1,79 +1,102 @@
-import itertools
+from array import array
+import heapq
+from itertools import compress
+from operator import lt
+import re
+
+from flat_grid import parse_digit_grid
 
 
 def parse_heightmap(input):
-    return [[int(num) for num in line] for line in input]
+    return parse_digit_grid(input)
 
 
-def generate_all_points(heightmap):
-    return itertools.product(range(len(heightmap[0])), range(len(heightmap)))
+def low_point_flags(heightmap):
+    # Padding cells equal the padding next to them, so they are never flagged.
+    lowest_neighbours = map(min, *(heightmap.band(offset) for offset in (-1, 1, -heightmap.stride, heightmap.stride)))
+    return bytes(map(lt, heightmap.band(), lowest_neighbours))
 
 
-def get_value(heightmap, x, y):
-    return heightmap[y][x]
+def low_points(heightmap):
+    return map(heightmap.point, compress(heightmap.band_indices(), low_point_flags(heightmap)))
 
 
-def neighbours_of_point(heightmap, x, y):
-    if x - 1 >= 0:
-        yield (x - 1, y)
-    if x + 1 < len(heightmap[0]):
-        yield (x + 1, y)
-    if y - 1 >= 0:
-        yield (x, y - 1)
-    if y + 1 < len(heightmap):
-        yield (x, y + 1)
+def sum_risk_levels(heightmap):
+    flags = low_point_flags(heightmap)
+    return sum(compress(heightmap.band(), flags)) + flags.count(1)
 
 
-def flow_downward(heightmap, x, y):
-    value = get_value(heightmap, x, y)
-    neighbours = neighbours_of_point(heightmap, x, y)
-    lowest_neighbour = min(neighbours, key=lambda point: get_value(heightmap, *point))
-    return lowest_neighbour if get_value(heightmap, *lowest_neighbour) <= value else None
+# Heights are digits, so in a row of height bytes every run of cells lower than 9 is one match.
+BASIN_RUN_REGEX = re.compile(rb'[\x00-\x08]+')
 
 
-def is_low_point(heightmap, x, y):
-    return flow_downward(heightmap, x, y) is None
+class RunForest:
+    # Union-find with path halving, keeping the lower id as the root.
+    def __init__(self):
+        self.parent = array('i')
+        self.lengths = array('q')
 
 
-def low_points(heightmap):
-    return filter(lambda point: is_low_point(heightmap, *point), generate_all_points(heightmap))
+    def add(self, length):
+        self.parent.append(len(self.parent))
+        self.lengths.append(length)
+        return len(self.parent) - 1
 
 
-def sum_risk_levels(heightmap):
-    return sum(1 + get_value(heightmap, *point) for point in low_points(heightmap))
+    def find(self, run):
+        parent = self.parent
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
 
 
-def get_basin_flow(heightmap, point):
-    flow = [point]
-    next_point = flow_downward(heightmap, *point)
-    if next_point is not None:
-        flow += get_basin_flow(heightmap, next_point)
-    return flow
+    def union(self, first, second):
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[max(first, second)] = min(first, second)
 
 
-def map_points_to_basins(heightmap):
-    basin_map = {point: {point} for point in low_points(heightmap)}
-    mapped_points = set(basin_map.keys())
-    locations_below_9 = filter(lambda p: get_value(heightmap, *p) != 9, generate_all_points(heightmap))
-    for point in locations_below_9:
-        if point in mapped_points:
-            continue
-        flow = get_basin_flow(heightmap, point)
-        basin_map[flow[-1]].update(flow)
-        mapped_points.update(flow)
-    return basin_map
+    def component_sizes(self):
+        sizes = array('q', bytes(len(self.lengths) * array('q').itemsize))
+        for run, length in enumerate(self.lengths):
+            sizes[self.find(run)] += length
+        return sizes
 
 
-def get_three_largest_basins_product(basins):
-    sorted_by_length = sorted(map(len, basins), reverse=True)
-    a, b, c = sorted_by_length[:3]
+def measure_basins(rows):
+    # A run of cells other than 9 joins every run above it sharing a column.
+    forest = RunForest()
+    previous = []
+    for row in rows:
+        current = [(match.start(), match.end(), forest.add(match.end() - match.start()))
+            for match in BASIN_RUN_REGEX.finditer(bytes(row))]
+        above_idx = current_idx = 0
+        while above_idx < len(previous) and current_idx < len(current):
+            above_start, above_end, above_run = previous[above_idx]
+            start, end, run = current[current_idx]
+            if above_start < end and start < above_end:
+                forest.union(above_run, run)
+            if above_end < end:
+                above_idx += 1
+            else:
+                current_idx += 1
+        previous = current
+    return forest.component_sizes()
+
+
+def get_three_largest_basins_product(basin_sizes):
+    a, b, c = heapq.nlargest(3, basin_sizes)
     return a * b * c
 
 
-def resolve_part1(input):
-    return sum_risk_levels(parse_heightmap(input))
+def parse(input):
+    return parse_heightmap(input)
+
+
+def resolve_part1(heightmap):
+    return sum_risk_levels(heightmap)
 
 
-def resolve_part2(input):
-    basins_map = map_points_to_basins(parse_heightmap(input))
-    return get_three_largest_basins_product(basins_map.values())
\ No newline at end of file
+def resolve_part2(heightmap):
+    return get_three_largest_basins_product(measure_basins(heightmap.rows()))
\ No newline at end of file
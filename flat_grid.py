@@ -0,0 +1,60 @@
+from typing import NamedTuple
+
+
+PAD = 0xFF
+DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+class FlatGrid(NamedTuple):
+    # A border of PAD cells gives every grid cell all four neighbours.
+    cells: bytes
+    width: int
+    height: int
+
+
+    @property
+    def stride(self):
+        return self.width + 2
+
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + x + 1
+
+
+    def point(self, index):
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+
+    def neighbour_indices(self, index):
+        cells = self.cells
+        return [neighbour for neighbour in (index - 1, index + 1, index - self.stride, index + self.stride)
+            if cells[neighbour] != PAD]
+
+
+    def rows(self):
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield self.cells[start:start + self.width]
+
+
+    def band(self, offset=0):
+        # Interior rows, padding columns included.
+        start = self.stride + offset
+        return self.cells[start:start + self.height * self.stride]
+
+
+    def band_indices(self):
+        return range(self.stride, self.stride + self.height * self.stride)
+
+
+def grid_from_rows(rows):
+    rows = list(rows)
+    width = len(rows[0]) if rows else 0
+    padding_row = bytes([PAD]) * (width + 2)
+    padded_rows = (bytes([PAD]) + row + bytes([PAD]) for row in rows)
+    return FlatGrid(b''.join([padding_row, *padded_rows, padding_row]), width, len(rows))
+
+
+def parse_digit_grid(lines):
+    return grid_from_rows(line.encode().translate(DIGIT_VALUES) for line in lines)
@@ -0,0 +1,19 @@
+from importlib import import_module
+import random
+
+
+def load_generator(day):
+    return import_module(f'generators.day_{day}').generate
+
+
+def generate_text(day, seed=0, **params):
+    return load_generator(day)(random.Random(seed), **params)
+
+
+def generate_lines(day, seed=0, **params):
+    return ''.join(generate_text(day, seed, **params)).splitlines()
+
+
+def write_input(path, day, seed=0, **params):
+    with open(path, 'w') as file:
+        file.writelines(generate_text(day, seed, **params))
@@ -0,0 +1,37 @@
+import argparse
+import ast
+import sys
+
+from generators import generate_text, write_input
+from runner import DAYS
+
+
+def parse_param(spec):
+    name, separator, value = spec.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f'expected key=value, got {spec!r}')
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Advent of code 2021 input generators')
+    parser.add_argument('--day', '-d', help='day in advent', type=int, choices=DAYS, metavar='DAY',
+        required=True)
+    parser.add_argument('--seed', '-s', help='seed of the random generator', type=int, default=0)
+    parser.add_argument('--output', '-o', help='output file (stdout by default)')
+    parser.add_argument('--param', help='size parameter of the generator, e.g. boards=1000000', type=parse_param,
+        action='append', default=[])
+
+    args = vars(parser.parse_args())
+
+    params = dict(args['param'])
+    if args['output'] is None:
+        sys.stdout.writelines(generate_text(args['day'], args['seed'], **params))
+        return
+    write_input(args['output'], args['day'], args['seed'], **params)
+
+
+main()
@@ -0,0 +1,21 @@
+import itertools
+
+
+TOKENS_PER_CHUNK = 4096
+
+
+def as_lines(lines):
+    return (f'{line}\n' for line in lines)
+
+
+def joined_line(tokens, separator=','):
+    tokens = iter(tokens)
+    first_chunk = True
+    while chunk := list(itertools.islice(tokens, TOKENS_PER_CHUNK)):
+        yield ('' if first_chunk else separator) + separator.join(chunk)
+        first_chunk = False
+    yield '\n'
+
+
+def grid_of_symbols(rng, width, height, symbols):
+    return as_lines(''.join(rng.choices(symbols, k=width)) for _ in range(height))
@@ -0,0 +1,5 @@
+def generate(rng, lines=2000, start=100, max_step=30):
+    depth = start
+    for _ in range(lines):
+        depth = max(0, depth + rng.randint(-max_step // 3, max_step))
+        yield f'{depth}\n'
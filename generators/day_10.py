@@ -0,0 +1,19 @@
+OPENINGS = '([{<'
+CLOSINGS = ')]}>'
+
+
+def generate(rng, lines=100, line_length=100, corrupted_ratio=0.5):
+    for _ in range(lines):
+        line, opened = [], []
+        for _ in range(line_length):
+            if opened and rng.random() < 0.45:
+                line.append(CLOSINGS[opened.pop()])
+            else:
+                opened.append(rng.randrange(4))
+                line.append(OPENINGS[opened[-1]])
+        if not opened:
+            opened.append(rng.randrange(4))
+            line.append(OPENINGS[opened[-1]])
+        if rng.random() < corrupted_ratio:
+            line.append(CLOSINGS[(opened[-1] + rng.randrange(1, 4)) % 4])
+        yield ''.join(line) + '\n'
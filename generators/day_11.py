@@ -0,0 +1,9 @@
+from day_11 import GRID_SIZE
+from generators.common import as_lines
+
+
+def generate(rng, dominant_share=0.9):
+    dominant = rng.randrange(10)
+    def energy():
+        return dominant if rng.random() < dominant_share else rng.randrange(10)
+    return as_lines(''.join(str(energy()) for _ in range(GRID_SIZE)) for _ in range(GRID_SIZE))
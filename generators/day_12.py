@@ -0,0 +1,20 @@
+import itertools
+import string
+
+
+def generate(rng, small_caves=6, big_caves=2, connections=12):
+    small = rng.sample([a + b for a, b in itertools.product(string.ascii_lowercase, repeat=2)], small_caves)
+    big = rng.sample([a + b for a, b in itertools.product(string.ascii_uppercase, repeat=2)], big_caves)
+    caves = small + big
+    rng.shuffle(caves)
+    # Link every cave to an earlier one so the system is connected; big caves never meet directly,
+    # as a big-big edge would allow infinitely many paths.
+    edges = set()
+    for idx, cave in enumerate(caves[1:], 1):
+        linked = [other for other in caves[:idx] if cave in small or other in small]
+        edges.add((rng.choice(linked or small), cave))
+    candidates = [pair for pair in itertools.combinations(caves, 2) if not (pair[0] in big and pair[1] in big)]
+    edges.update(rng.sample(candidates, min(max(connections - len(edges), 0), len(candidates))))
+    edges.update({('start', rng.choice(caves)), (rng.choice(caves), 'end')})
+    for source, destination in sorted(edges):
+        yield f'{source}-{destination}\n'
@@ -0,0 +1,23 @@
+def generate(rng, dots=800, folds=12, final_width=40, final_height=6):
+    width, height = final_width, final_height
+    points = {(rng.randrange(width), rng.randrange(height)) for _ in range(dots)}
+    fold_lines = []
+    for idx in range(folds):
+        direction = 'x' if width <= height else 'y'
+        line = width if direction == 'x' else height
+        def unfold(point):
+            x, y = point
+            if rng.random() < 0.5:
+                return point
+            return (2 * line - x, y) if direction == 'x' else (x, 2 * line - y)
+        points = {unfold(point) for point in points}
+        if direction == 'x':
+            width = 2 * width + 1
+        else:
+            height = 2 * height + 1
+        fold_lines.append((direction, line))
+    for x, y in points:
+        yield f'{x},{y}\n'
+    yield '\n'
+    for direction, line in reversed(fold_lines):
+        yield f'fold along {direction}={line}\n'
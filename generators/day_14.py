@@ -0,0 +1,8 @@
+import itertools
+
+
+def generate(rng, template_length=20, elements='BCFHKNOPSV'):
+    yield ''.join(rng.choices(elements, k=template_length)) + '\n'
+    yield '\n'
+    for first, second in itertools.product(elements, repeat=2):
+        yield f'{first}{second} -> {rng.choice(elements)}\n'
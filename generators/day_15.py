@@ -0,0 +1,5 @@
+from generators.common import grid_of_symbols
+
+
+def generate(rng, size=100):
+    return grid_of_symbols(rng, size, size, '123456789')
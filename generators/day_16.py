@@ -0,0 +1,35 @@
+from day_16 import GT_PACKET_ID, LITERAL_PACKET_ID, LT_PACKET_ID
+
+
+OPERATOR_IDS = (0, 1, 2, 3, 5, 6, 7)
+COMPARISON_IDS = (GT_PACKET_ID, LT_PACKET_ID, 7)
+LENGTH_BITS = 15
+COUNT_BITS = 11
+
+
+def encode_literal(value):
+    digits = format(value, 'b')
+    digits = digits.zfill(-(-len(digits) // 4) * 4)
+    groups = [digits[idx:idx + 4] for idx in range(0, len(digits), 4)]
+    return ''.join(('1' if idx < len(groups) - 1 else '0') + group for idx, group in enumerate(groups))
+
+
+def generate_packet(rng, depth, max_children):
+    version = format(rng.randrange(8), '03b')
+    if depth == 0 or rng.random() < 0.3:
+        return version + format(LITERAL_PACKET_ID, '03b') + encode_literal(rng.randrange(1 << rng.randint(1, 20)))
+    packet_id = rng.choice(OPERATOR_IDS)
+    children_count = 2 if packet_id in COMPARISON_IDS else rng.randint(1, min(max_children, (1 << COUNT_BITS) - 1))
+    children = ''.join(generate_packet(rng, depth - 1, max_children) for _ in range(children_count))
+    # Children too long for the length field are counted instead.
+    if len(children) < 1 << LENGTH_BITS and rng.random() < 0.5:
+        length = '0' + format(len(children), f'0{LENGTH_BITS}b')
+    else:
+        length = '1' + format(children_count, f'0{COUNT_BITS}b')
+    return version + format(packet_id, '03b') + length + children
+
+
+def generate(rng, depth=6, max_children=4):
+    bits = generate_packet(rng, depth, max_children)
+    bits += '0' * (-len(bits) % 4)
+    yield ''.join(format(int(bits[idx:idx + 4], 2), 'X') for idx in range(0, len(bits), 4)) + '\n'
@@ -0,0 +1,6 @@
+def generate(rng):
+    x_min = rng.randint(20, 150)
+    x_max = rng.randint(x_min + 20, min(x_min + 45, 199))
+    y_max = -rng.randint(5, 80)
+    y_min = y_max - rng.randint(5, 40)
+    yield f'target area: x={x_min}..{x_max}, y={y_min}..{y_max}\n'
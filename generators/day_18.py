@@ -0,0 +1,9 @@
+def generate_number(rng, depth):
+    if depth == 4 or depth > 0 and rng.random() < 0.3:
+        return str(rng.randrange(10))
+    return f'[{generate_number(rng, depth + 1)},{generate_number(rng, depth + 1)}]'
+
+
+def generate(rng, numbers=100):
+    for _ in range(numbers):
+        yield generate_number(rng, depth=0) + '\n'
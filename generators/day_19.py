@@ -0,0 +1,23 @@
+from day_19 import Vector3D, generate_all_orientations
+
+
+SCANNER_RANGE = 1000
+
+
+def generate(rng, scanners=4, spacing=400, beacons_in_range=30):
+    length = spacing * (scanners - 1) + 2 * SCANNER_RANGE
+    def random_beacon():
+        return Vector3D(rng.randrange(-SCANNER_RANGE, length - SCANNER_RANGE),
+            rng.randrange(-SCANNER_RANGE, SCANNER_RANGE), rng.randrange(-SCANNER_RANGE, SCANNER_RANGE))
+    beacons = [random_beacon() for _ in range(beacons_in_range * length // (2 * SCANNER_RANGE))]
+    orientations = generate_all_orientations()
+    for scanner in range(scanners):
+        position = Vector3D(scanner * spacing, 0, 0)
+        orientation = orientations[0] if scanner == 0 else rng.choice(orientations)
+        relative = (beacon - position for beacon in beacons)
+        visible = (orientation * beacon for beacon in relative if all(abs(coord) < SCANNER_RANGE for coord in beacon))
+        if scanner > 0:
+            yield '\n'
+        yield f'--- scanner {scanner} ---\n'
+        for beacon in visible:
+            yield f'{beacon.x},{beacon.y},{beacon.z}\n'
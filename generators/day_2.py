@@ -0,0 +1,4 @@
+def generate(rng, lines=1000, max_units=9):
+    for _ in range(lines):
+        command = rng.choices(('forward', 'down', 'up'), weights=(2, 2, 1))[0]
+        yield f'{command} {rng.randint(1, max_units)}\n'
@@ -0,0 +1,10 @@
+from generators.common import grid_of_symbols
+
+
+def generate(rng, size=100):
+    algorithm = rng.choices('#.', k=512)
+    if algorithm[0] == '#':
+        algorithm[-1] = '.'
+    yield ''.join(algorithm) + '\n'
+    yield '\n'
+    yield from grid_of_symbols(rng, size, size, '#.')
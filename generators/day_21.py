@@ -0,0 +1,3 @@
+def generate(rng):
+    for player in (1, 2):
+        yield f'Player {player} starting position: {rng.randint(1, 10)}\n'
@@ -0,0 +1,14 @@
+def random_interval(rng, low, high, max_length):
+    begin = rng.randint(low, high)
+    return begin, min(high, begin + rng.randint(0, max_length))
+
+
+def generate(rng, steps=420, initialization_steps=20, extent=100000, max_length=30000):
+    for idx in range(steps):
+        if idx < initialization_steps:
+            intervals = [random_interval(rng, -50, 50, 50) for _ in range(3)]
+        else:
+            intervals = [random_interval(rng, -extent, extent, max_length) for _ in range(3)]
+        instruction = 'on' if idx == 0 or rng.random() < 0.6 else 'off'
+        (x1, x2), (y1, y2), (z1, z2) = intervals
+        yield f'{instruction} x={x1}..{x2},y={y1}..{y2},z={z1}..{z2}\n'
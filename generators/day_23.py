@@ -0,0 +1,8 @@
+def generate(rng):
+    amphipods = list('AABBCCDD')
+    rng.shuffle(amphipods)
+    yield '#############\n'
+    yield '#...........#\n'
+    yield '###' + '#'.join(amphipods[:4]) + '###\n'
+    yield '  #' + '#'.join(amphipods[4:]) + '#\n'
+    yield '  #########\n'
@@ -0,0 +1,44 @@
+DIGITS = 14
+MONAD_BLOCK = '''inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {x_component}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {y_component}
+mul y x
+add z y
+'''
+
+
+def random_pushes_and_pops(rng):
+    sequence, opened = [], 0
+    for idx in range(DIGITS):
+        remaining = DIGITS - idx
+        if opened == remaining or opened > 0 and rng.random() < 0.5:
+            sequence.append(False)
+            opened -= 1
+        else:
+            sequence.append(True)
+            opened += 1
+    return sequence
+
+
+def generate(rng):
+    pushed_y_components = []
+    for is_push in random_pushes_and_pops(rng):
+        if is_push:
+            x_component, y_component = rng.randint(10, 15), rng.randint(1, 16)
+            pushed_y_components.append(y_component)
+        else:
+            x_component, y_component = rng.randint(-8, 8) - pushed_y_components.pop(), rng.randint(1, 16)
+        yield MONAD_BLOCK.format(divisor=1 if is_push else 26, x_component=x_component, y_component=y_component)
@@ -0,0 +1,5 @@
+from generators.common import grid_of_symbols
+
+
+def generate(rng, width=139, height=137):
+    return grid_of_symbols(rng, width, height, '>v.')
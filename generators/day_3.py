@@ -0,0 +1,13 @@
+def generate(rng, lines=1001, bits=12):
+    # An odd count of distinct numbers keeps every column free of ties between ones and zeros.
+    # Distinct numbers come lazily from a seeded bijection of range(2**bits): an affine map, an xorshift and a
+    # multiplication by an odd number each permute bits-wide integers.
+    mask = (1 << bits) - 1
+    first_multiplier, second_multiplier = rng.getrandbits(bits) | 1, rng.getrandbits(bits) | 1
+    offset, start = rng.getrandbits(bits), rng.getrandbits(bits)
+    shift = bits // 2 + 1
+    for idx in range(min(lines, 1 << bits)):
+        number = (first_multiplier * ((start + idx) & mask) + offset) & mask
+        number ^= number >> shift
+        number = (second_multiplier * number) & mask
+        yield format(number, f'0{bits}b') + '\n'
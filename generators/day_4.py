@@ -0,0 +1,13 @@
+from generators.common import joined_line
+
+
+def generate(rng, boards=100, max_number=99):
+    numbers = list(range(max_number + 1))
+    rng.shuffle(numbers)
+    yield from joined_line(map(str, numbers))
+    width = len(str(max_number))
+    for _ in range(boards):
+        board = rng.sample(numbers, 25)
+        yield '\n'
+        for row in range(5):
+            yield ' '.join(str(num).rjust(width) for num in board[5 * row:5 * row + 5]) + '\n'
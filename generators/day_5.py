@@ -0,0 +1,17 @@
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+
+def generate(rng, lines=500, plane_size=1000):
+    for _ in range(lines):
+        x, y = rng.randrange(plane_size), rng.randrange(plane_size)
+        dx, dy = rng.choice(DIRECTIONS)
+        reach = [plane_size // 2]
+        if dx:
+            reach.append(plane_size - 1 - x)
+        if dy:
+            reach.append(plane_size - 1 - y if dy > 0 else y)
+        length = rng.randrange(min(reach) + 1)
+        begin, end = (x, y), (x + dx * length, y + dy * length)
+        if rng.random() < 0.5:
+            begin, end = end, begin
+        yield f'{begin[0]},{begin[1]} -> {end[0]},{end[1]}\n'
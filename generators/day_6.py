@@ -0,0 +1,5 @@
+from generators.common import joined_line
+
+
+def generate(rng, fish=300):
+    return joined_line(str(rng.randint(1, 5)) for _ in range(fish))
@@ -0,0 +1,5 @@
+from generators.common import joined_line
+
+
+def generate(rng, crabs=1000, max_position=2000):
+    return joined_line(str(int(rng.triangular(0, max_position, max_position / 4))) for _ in range(crabs))
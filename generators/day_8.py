@@ -0,0 +1,16 @@
+from day_8 import DIGITS_BY_SEGMENTS
+
+
+SEGMENTS = 'abcdefg'
+
+
+def generate(rng, displays=200):
+    for _ in range(displays):
+        wiring = dict(zip(SEGMENTS, rng.sample(SEGMENTS, len(SEGMENTS))))
+        def scrambled(digit):
+            wires = [wiring[segment] for segment in DIGITS_BY_SEGMENTS[digit]]
+            rng.shuffle(wires)
+            return ''.join(wires)
+        patterns = [scrambled(digit) for digit in rng.sample(range(10), 10)]
+        output = [scrambled(rng.randrange(10)) for _ in range(4)]
+        yield f'{" ".join(patterns)} | {" ".join(output)}\n'
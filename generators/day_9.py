@@ -0,0 +1,31 @@
+import math
+
+from generators.common import as_lines
+
+
+def spans_between_walls(rng, length, max_span):
+    start = 0
+    while start < length:
+        end = min(length, start + rng.randint(1, max_span))
+        yield start, end
+        start = end + 1
+
+
+def generate(rng, size=100, cells_per_basin=30):
+    # Rows are laid out band by band: bands of rows are split by walls of 9 into rectangular basins, whose heights
+    # grow with the distance from one low point, so only the current band's basins are kept in memory.
+    max_span = max(1, 2 * round(math.sqrt(cells_per_basin)) - 1)
+    ramp = '012345678' + '8' * 2 * max_span
+    def band_rows(top, bottom):
+        basins = [(left, right, rng.randrange(left, right), rng.randrange(top, bottom))
+            for left, right in spans_between_walls(rng, size, max_span)]
+        for y in range(top, bottom):
+            segments = (ramp[abs(y - low_y) + 1:abs(y - low_y) + 1 + low_x - left][::-1] + ramp[abs(y - low_y)]
+                + ramp[abs(y - low_y) + 1:abs(y - low_y) + right - low_x] for left, right, low_x, low_y in basins)
+            yield '9'.join(segments).ljust(size, '9')
+        if bottom < size:
+            yield '9' * size
+    def rows():
+        for top, bottom in spans_between_walls(rng, size, max_span):
+            yield from band_rows(top, bottom)
+    return as_lines(rows())
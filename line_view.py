@@ -0,0 +1,72 @@
+from array import array
+import mmap
+
+
+def _strip_line(raw):
+    return raw.decode().rstrip()
+
+
+class MappedLines:
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            is_empty = file.seek(0, 2) == 0
+            self._mapped = b'' if is_empty else mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = None
+
+
+    def __iter__(self):
+        mapped, start, size = self._mapped, 0, len(self._mapped)
+        while start < size:
+            end = mapped.find(b'\n', start)
+            if end == -1:
+                end = size
+            yield _strip_line(mapped[start:end])
+            start = end + 1
+
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __len__(self):
+        return len(self._line_offsets()) - 1
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        offsets = self._line_offsets()
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('line index out of range')
+        return _strip_line(self._mapped[offsets[index]:offsets[index + 1] - 1])
+
+
+    def _line_offsets(self):
+        if self._offsets is None:
+            mapped, size = self._mapped, len(self._mapped)
+            self._offsets = array('Q', [0])
+            end = mapped.find(b'\n')
+            while end != -1 and end + 1 < size:
+                self._offsets.append(end + 1)
+                end = mapped.find(b'\n', end + 1)
+            if size > 0:
+                self._offsets.append(size + 1 if end == -1 else size)
+        return self._offsets
+
+
+class StreamedInput:
+    def __init__(self, path):
+        self._path = path
+
+
+    def __iter__(self):
+        with open(self._path) as file:
+            for line in file:
+                yield line.rstrip()
+
+
+    def chunks(self, size=1 << 20):
+        with open(self._path) as file:
+            yield from iter(lambda: file.read(size), '')
@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+import cProfile
+import pstats
+import tracemalloc
+
+
+@contextmanager
+def profiled(pstats_file, top):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(pstats_file)
+        print(f'Profile saved to {pstats_file}, top {top} functions by cumulative time:')
+        pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+
+@contextmanager
+def traced_allocations(top, frames=1):
+    tracemalloc.start(frames)
+    try:
+        yield
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(f'Peak traced memory: {peak / 2**20:.2f} MiB, top {top} allocation sites still alive:')
+    for statistic in snapshot.statistics('lineno')[:top]:
+        print(f'  {statistic}')
@@ -0,0 +1,24 @@
+_callback = None
+_counters = {}
+
+
+def set_progress_callback(callback):
+    global _callback
+    _callback = callback
+    _counters.clear()
+
+
+def is_listening():
+    return _callback is not None
+
+
+def report_progress(**counters):
+    if _callback is not None:
+        _counters.update(counters)
+        _callback(_counters)
+
+
+def advance_progress(counter, amount=1):
+    if _callback is not None:
+        _counters[counter] = _counters.get(counter, 0) + amount
+        _callback(_counters)
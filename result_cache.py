@@ -0,0 +1,107 @@
+import ast
+import hashlib
+from importlib.util import find_spec
+import json
+import os
+
+
+DEFAULT_CACHE_DIR = '.aoc_cache'
+DEFAULT_CACHE_SIZE = 1000
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def module_source_path(day):
+    spec = find_spec(f'day_{day}')
+    if spec is None:
+        raise ImportError(f'No module named day_{day}')
+    return spec.origin
+
+
+def local_dependency_paths(source_path):
+    # Repo-local modules imported by the solver, directly or through each other, as their answers depend on them too.
+    root = os.path.dirname(source_path)
+    paths, pending = set(), [source_path]
+    while pending:
+        with open(pending.pop(), 'rb') as file:
+            tree = ast.parse(file.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module is not None:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                spec = find_spec(name.partition('.')[0])
+                origin = spec.origin if spec is not None else None
+                if origin is not None and os.path.dirname(origin) == root and origin not in paths:
+                    paths.add(origin)
+                    pending.append(origin)
+    paths.discard(source_path)
+    return sorted(paths)
+
+
+def solver_digest(day):
+    source_path = module_source_path(day)
+    digest = hashlib.sha256(file_digest(source_path).encode())
+    for path in local_dependency_paths(source_path):
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=DEFAULT_CACHE_SIZE, refresh=False):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.refresh = refresh
+
+
+    def make_key(self, day, part, input_file):
+        return f'{file_digest(input_file)}-{solver_digest(day)}-{part}'
+
+
+    def get(self, key):
+        if self.refresh:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+
+    def put(self, key, answer):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._entry_path(key)
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump({'answer': answer}, file)
+        os.replace(temporary_path, path)
+        self._evict_least_recently_used()
+
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+
+    def _evict_least_recently_used(self):
+        with os.scandir(self.directory) as entries:
+            cached = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith('.json')]
+        if len(cached) <= self.max_entries:
+            return
+        cached.sort()
+        for _, path in cached[:len(cached) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -1,29 +1,287 @@
 import argparse
+from contextlib import ExitStack, nullcontext
+import copy
+import csv
+import functools
+import glob
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from importlib import import_module
+import json
+import os
 import sys
+import time
 
-parser = argparse.ArgumentParser(description='Advent of code 2021')
-parser.add_argument('--day', '-d', help='day in advent', type=int, required=True)
-parser.add_argument('--part', '-p', help='part of puzzle to solve', choices=['1', '2', 'both'], default='both')
-parser.add_argument('--input', '-i', help='input file')
+from line_view import MappedLines, StreamedInput
+from profiling import profiled, traced_allocations
+from result_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, ResultCache
 
 
-args = vars(parser.parse_args())
+DAYS = range(1, 26)
 
-day = args['day']
-input_file = args['input'] if args['input'] is not None else f'day_{day}.in'
 
-with open(input_file) as file:
-    lines = [line.rstrip() for line in file]
+def parse_days(spec):
+    days = set()
+    for chunk in spec.split(','):
+        first, _, last = chunk.partition('-')
+        days.update(range(int(first), int(last or first) + 1))
+    if not days.issubset(DAYS):
+        raise argparse.ArgumentTypeError(f'days must be within {DAYS.start}-{DAYS.stop - 1}')
+    return sorted(days)
 
-try:
-    daily_module = import_module(f'day_{day}')
-except ImportError:
-    print('Specified day is invalid')
-    sys.exit(1)
 
-part_to_solve = args['part']
-if part_to_solve in ('1', 'both'):
-    print('Part 1 solution:', getattr(daily_module, 'resolve_part1')(lines))
-if part_to_solve in ('2', 'both'):
-    print('Part 2 solution:', getattr(daily_module, 'resolve_part2')(lines))
+def parts_to_solve(part):
+    return (1, 2) if part == 'both' else (int(part),)
+
+
+def default_input_file(day):
+    return f'day_{day}.in'
+
+
+def read_lines(input_file):
+    with open(input_file) as file:
+        return [line.rstrip() for line in file]
+
+
+def import_day(day):
+    return import_module(f'day_{day}')
+
+
+def parse_input(daily_module, lines):
+    parse = getattr(daily_module, 'parse', None)
+    return parse(lines) if parse is not None else lines
+
+
+def resolve(daily_module, part, lines):
+    return getattr(daily_module, f'resolve_part{part}')(parse_input(daily_module, lines))
+
+
+def load_input(input_file, input_mode):
+    if input_mode == 'mmap':
+        return MappedLines(input_file)
+    return read_lines(input_file)
+
+
+def solve_day(day, parts, input_file, cache=None, instrument=None, input_mode='lines', lines=None):
+    inline_lines = lines
+    daily_module = None
+    parsed = None
+    for idx, part in enumerate(parts):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        key = cache.make_key(day, part, input_file) if cache is not None and inline_lines is None else None
+        cached = cache.get(key) if key is not None else None
+        parse_time = 0
+        if cached is not None:
+            answer = cached['answer']
+        else:
+            if daily_module is None:
+                daily_module = import_day(day)
+            resolve_part = getattr(daily_module, f'resolve_part{part}')
+            stream_resolve_part = getattr(daily_module, f'resolve_part{part}_stream', None)
+            if input_mode == 'stream' and stream_resolve_part is not None and inline_lines is None:
+                resolve_part, part_input = stream_resolve_part, StreamedInput(input_file)
+            else:
+                if parsed is None:
+                    if lines is None:
+                        lines = load_input(input_file, 'mmap' if input_mode == 'stream' else input_mode)
+                    parse_start = time.perf_counter()
+                    parsed = parse_input(daily_module, lines)
+                else:
+                    parse_start = time.perf_counter()
+                is_last_part = idx == len(parts) - 1
+                part_input = parsed if is_last_part else copy.deepcopy(parsed)
+                parse_time = time.perf_counter() - parse_start
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            with instrument(day, part) if instrument is not None else nullcontext():
+                answer = resolve_part(part_input)
+            if key is not None:
+                cache.put(key, answer)
+        yield {
+            'day': day,
+            'part': part,
+            'answer': answer,
+            'cached': cached is not None,
+            'parse_time': parse_time,
+            'wall_time': time.perf_counter() - wall_start,
+            'cpu_time': time.process_time() - cpu_start,
+            'pid': os.getpid(),
+        }
+
+
+def solve_part(day, part, input_file, cache=None, input_mode='lines'):
+    return next(solve_day(day, (part,), input_file, cache, input_mode=input_mode))
+
+
+def run_batch(days, parts, workers, cache=None, input_mode='lines', timeout=None, max_memory=None):
+    if timeout is None and max_memory is None:
+        executor, solve = ProcessPoolExecutor(max_workers=workers), solve_part
+    else:
+        from supervisor import run_supervised
+        executor = ThreadPoolExecutor(max_workers=workers)
+        solve = functools.partial(run_supervised, timeout=timeout, max_memory=max_memory)
+    with executor:
+        futures = [(day, part, executor.submit(solve, day, part, default_input_file(day), cache, input_mode))
+            for day in days for part in parts]
+        results = []
+        for day, part, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                results.append({'day': day, 'part': part, 'error': f'{type(error).__name__}: {error}'})
+    return results
+
+
+def solve_input(day, parts, input_file, cache=None, input_mode='lines'):
+    try:
+        return {'input': input_file, 'results': list(solve_day(day, parts, input_file, cache, input_mode=input_mode))}
+    except Exception as error:
+        return {'input': input_file, 'error': f'{type(error).__name__}: {error}'}
+
+
+def run_fan_out(day, parts, input_files, workers, cache=None, input_mode='lines'):
+    with ProcessPoolExecutor(max_workers=workers, initializer=import_day, initargs=(day,)) as executor:
+        solve = functools.partial(solve_input, day, parts, cache=cache, input_mode=input_mode)
+        return list(executor.map(solve, input_files))
+
+
+def manifest_row(entry, parts):
+    row = {'input': entry['input']}
+    results = {result['part']: result for result in entry.get('results', ())}
+    for part in parts:
+        result = results.get(part, {})
+        row[f'part{part}_answer'] = result.get('answer')
+        row[f'part{part}_time'] = result.get('parse_time', 0) + result.get('wall_time', 0) if result else None
+    row['error'] = entry.get('error')
+    return row
+
+
+def write_manifest(entries, parts, manifest_file):
+    rows = [manifest_row(entry, parts) for entry in entries]
+    if manifest_file.endswith('.json'):
+        with open(manifest_file, 'w') as file:
+            json.dump(rows, file, indent=2, default=str)
+        return
+    with open(manifest_file, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()) if rows else ['input'])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_report(results, total_wall_time, report_file):
+    report = {'wall_time': total_wall_time, 'results': results}
+    if report_file is None:
+        json.dump(report, sys.stdout, indent=2, default=str)
+        print()
+        return
+    with open(report_file, 'w') as file:
+        json.dump(report, file, indent=2, default=str)
+
+
+def instrumentation(args):
+    def instrument(day, part):
+        stack = ExitStack()
+        if args['trace_alloc']:
+            stack.enter_context(traced_allocations(args['top']))
+        if args['profile']:
+            pstats_file = os.path.join(args['profile_dir'], f'day_{day}_part{part}.pstats')
+            stack.enter_context(profiled(pstats_file, args['top']))
+        return stack
+    return instrument
+
+
+def main():
+    if sys.argv[1:2] == ['serve']:
+        from solver_daemon import serve_main
+        serve_main(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description='Advent of code 2021')
+    days_group = parser.add_mutually_exclusive_group(required=True)
+    days_group.add_argument('--day', '-d', help='day in advent', type=int)
+    days_group.add_argument('--days', help='days to solve in batch, e.g. 1-25 or 1,3,5-7', type=parse_days)
+    days_group.add_argument('--all', '-a', help='solve all days in batch', action='store_true')
+    parser.add_argument('--part', '-p', help='part of puzzle to solve', choices=['1', '2', 'both'], default='both')
+    inputs_group = parser.add_mutually_exclusive_group()
+    inputs_group.add_argument('--input', '-i', help='input file')
+    inputs_group.add_argument('--input-dir', help='solve the day for every file in this directory')
+    inputs_group.add_argument('--input-glob', help='solve the day for every file matching this pattern')
+    parser.add_argument('--manifest', help='CSV or JSON (by extension) manifest of answers and timings per input')
+    parser.add_argument('--input-mode', '-m', help='how input is handed to solvers: list of lines, lazy memory-mapped '
+        'line view, or line stream for days with resolve_partN_stream', choices=['lines', 'mmap', 'stream'], default='lines')
+    parser.add_argument('--workers', '-w', help='worker processes in batch mode', type=int, default=os.cpu_count())
+    parser.add_argument('--report', '-r', help='file for JSON report in batch mode (stdout by default)')
+    parser.add_argument('--timings', '-t', help='print parse and solve times of each part', action='store_true')
+    parser.add_argument('--timeout', help='stop a part after this many seconds', type=float)
+    parser.add_argument('--max-memory', help='stop a part exceeding this many MiB of address space', type=int)
+    parser.add_argument('--profile', help='run each part under cProfile and save a .pstats file', action='store_true')
+    parser.add_argument('--profile-dir', help='directory for .pstats files', default='.')
+    parser.add_argument('--trace-alloc', help='report peak memory and top allocation sites', action='store_true')
+    parser.add_argument('--top', help='number of functions or allocation sites to report', type=int, default=20)
+    parser.add_argument('--no-cache', help='neither read nor store cached answers', action='store_true')
+    parser.add_argument('--refresh', help='recompute answers and overwrite cached ones', action='store_true')
+    parser.add_argument('--cache-dir', help='directory of the result cache', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--cache-size', help='maximum number of cached answers', type=int, default=DEFAULT_CACHE_SIZE)
+
+    args = vars(parser.parse_args())
+
+    is_instrumented = args['profile'] or args['trace_alloc']
+    if is_instrumented and args['day'] is None:
+        parser.error('--profile and --trace-alloc require --day')
+
+    is_guarded = args['timeout'] is not None or args['max_memory'] is not None
+    if is_guarded and is_instrumented:
+        parser.error('--timeout and --max-memory cannot be combined with --profile or --trace-alloc')
+    max_memory = args['max_memory'] * 2**20 if args['max_memory'] is not None else None
+
+    parts = parts_to_solve(args['part'])
+    cache = None
+    if not args['no_cache'] and not is_instrumented:
+        cache = ResultCache(args['cache_dir'], args['cache_size'], refresh=args['refresh'])
+    if args['day'] is None:
+        days = list(DAYS) if args['all'] else args['days']
+        start = time.perf_counter()
+        results = run_batch(days, parts, args['workers'], cache, args['input_mode'], args['timeout'], max_memory)
+        write_report(results, time.perf_counter() - start, args['report'])
+        return
+
+    day = args['day']
+    if args['input_dir'] is not None or args['input_glob'] is not None:
+        if is_guarded or is_instrumented:
+            parser.error('--input-dir and --input-glob cannot be combined with guards or profiling')
+        pattern = args['input_glob'] or os.path.join(args['input_dir'], '*')
+        input_files = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+        start = time.perf_counter()
+        entries = run_fan_out(day, parts, input_files, args['workers'], cache, args['input_mode'])
+        elapsed = time.perf_counter() - start
+        if args['manifest'] is not None:
+            write_manifest(entries, parts, args['manifest'])
+        failed = sum(1 for entry in entries if 'error' in entry)
+        print(f'Solved {len(entries) - failed} of {len(entries)} inputs in {elapsed:.3f} s '
+            f'({len(entries) / elapsed:.2f} inputs/s)')
+        return
+
+    input_file = args['input'] if args['input'] is not None else default_input_file(day)
+
+    if is_guarded:
+        from supervisor import run_supervised
+        for part in parts:
+            result = run_supervised(day, part, input_file, cache, args['input_mode'], args['timeout'], max_memory)
+            if 'status' in result:
+                progress = ', '.join(f'{name}={value}' for name, value in result['progress'].items())
+                print(f'Part {part} stopped: {result["error"]}; progress: {progress or "none reported"}')
+            else:
+                print(f'Part {part} solution:', result['answer'])
+        return
+
+    try:
+        instrument = instrumentation(args) if is_instrumented else None
+        for result in solve_day(day, parts, input_file, cache, instrument, args['input_mode']):
+            print(f'Part {result["part"]} solution:', result['answer'])
+            if args['timings']:
+                print(f'  parse {result["parse_time"]:.4f} s, solve {result["wall_time"]:.4f} s')
+    except ImportError:
+        print('Specified day is invalid')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+def partition_around(values, low, high, pivot):
+    # Returns the bounds of the run equal to the pivot.
+    less, idx, greater = low, low, high
+    while idx <= greater:
+        value = values[idx]
+        if value < pivot:
+            values[less], values[idx] = value, values[less]
+            less += 1
+            idx += 1
+        elif value > pivot:
+            values[greater], values[idx] = value, values[greater]
+            greater -= 1
+        else:
+            idx += 1
+    return less, greater
+
+
+def median_of_medians(values, low, high):
+    groups = (sorted(values[start:min(start + 5, high + 1)]) for start in range(low, high + 1, 5))
+    medians = [group[(len(group) - 1) // 2] for group in groups]
+    return introselect(medians, (len(medians) - 1) // 2)
+
+
+def introselect(values, k):
+    # Median of medians takes over from median of three past 2 log n rounds.
+    low, high = 0, len(values) - 1
+    depth_limit = 2 * len(values).bit_length()
+    while low < high:
+        if depth_limit > 0:
+            pivot = sorted((values[low], values[(low + high) // 2], values[high]))[1]
+            depth_limit -= 1
+        else:
+            pivot = median_of_medians(values, low, high)
+        less, greater = partition_around(values, low, high, pivot)
+        if k < less:
+            high = less - 1
+        elif k > greater:
+            low = greater + 1
+        else:
+            return values[k]
+    return values[k]
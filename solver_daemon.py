@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import signal
+import socket
+import tempfile
+
+from result_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, ResultCache
+from runner import DAYS, import_day, parts_to_solve, solve_day
+
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'aoc2021.sock')
+# Requests may carry whole inputs inline, far beyond the default 64 KiB line limit of asyncio streams.
+REQUEST_LIMIT = 256 * 2**20
+
+
+def import_all_days():
+    for day in DAYS:
+        import_day(day)
+
+
+def solve_request(request, cache):
+    day = int(request['day'])
+    if day not in DAYS:
+        raise ValueError(f'Specified day is invalid: {day}')
+    parts = parts_to_solve(str(request.get('part', 'both')))
+    lines = request.get('lines')
+    input_file = request.get('input_path') if lines is None else None
+    if lines is None and input_file is None:
+        raise ValueError('Request needs either input_path or lines')
+    return list(solve_day(day, parts, input_file, cache, lines=lines))
+
+
+class SolverDaemon:
+    def __init__(self, workers, cache):
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=import_all_days)
+        self._cache = cache
+
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError) as error:
+                    writer.write(json.dumps({'error': f'Request too large: {error}'}).encode() + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                response = await self._respond(line)
+                writer.write(json.dumps(response, default=str).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+    async def _respond(self, line):
+        try:
+            request = json.loads(line)
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self._executor, solve_request, request, self._cache)
+            return {'results': results}
+        except Exception as error:
+            return {'error': f'{type(error).__name__}: {error}'}
+
+
+    async def serve(self, socket_path):
+        server = await asyncio.start_unix_server(self.handle_connection, path=socket_path, limit=REQUEST_LIMIT)
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, server.close)
+        print(f'Serving on {socket_path}')
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+
+def query(request, socket_path=DEFAULT_SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode() + b'\n')
+        with client.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(prog='runner.py serve', description='Advent of code 2021 solver daemon')
+    parser.add_argument('--socket', '-s', help='path of the unix domain socket', default=DEFAULT_SOCKET_PATH)
+    parser.add_argument('--workers', '-w', help='worker processes solving requests', type=int, default=os.cpu_count())
+    parser.add_argument('--no-cache', help='neither read nor store cached answers', action='store_true')
+    parser.add_argument('--cache-dir', help='directory of the result cache', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--cache-size', help='maximum number of cached answers', type=int, default=DEFAULT_CACHE_SIZE)
+
+    args = vars(parser.parse_args(argv))
+
+    cache = None if args['no_cache'] else ResultCache(args['cache_dir'], args['cache_size'])
+    import_all_days()
+    daemon = SolverDaemon(args['workers'], cache)
+    try:
+        asyncio.run(daemon.serve(args['socket']))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,82 @@
+import multiprocessing
+import resource
+import time
+
+from progress import set_progress_callback
+from runner import solve_part
+
+
+PROGRESS_INTERVAL = 0.5
+
+
+def limit_memory(max_memory):
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, hard_limit))
+
+
+def lift_memory_limit():
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (hard_limit, hard_limit))
+
+
+def progress_sender(connection):
+    next_send = 0
+    def send_progress(counters):
+        nonlocal next_send
+        now = time.monotonic()
+        if now >= next_send:
+            connection.send(('progress', dict(counters)))
+            next_send = now + PROGRESS_INTERVAL
+    return send_progress
+
+
+def run_part(connection, day, part, input_file, cache, input_mode, max_memory):
+    if max_memory is not None:
+        limit_memory(max_memory)
+    set_progress_callback(progress_sender(connection))
+    try:
+        message = ('result', solve_part(day, part, input_file, cache, input_mode))
+    except MemoryError:
+        message = ('memory', 'MemoryError: memory limit exceeded')
+    except Exception as error:
+        message = ('error', f'{type(error).__name__}: {error}')
+    lift_memory_limit()
+    connection.send(message)
+
+
+def stopped_part(day, part, status, error, progress, wall_time):
+    return {'day': day, 'part': part, 'status': status, 'error': error, 'progress': progress, 'wall_time': wall_time}
+
+
+def run_supervised(day, part, input_file, cache=None, input_mode='lines', timeout=None, max_memory=None):
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=run_part,
+        args=(sender, day, part, input_file, cache, input_mode, max_memory), daemon=True)
+    start = time.monotonic()
+    process.start()
+    sender.close()
+    progress = {}
+    try:
+        while True:
+            remaining = None if timeout is None else start + timeout - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return stopped_part(day, part, 'timeout', f'Timeout after {timeout} s', progress, time.monotonic() - start)
+            if not receiver.poll(remaining):
+                continue
+            try:
+                kind, payload = receiver.recv()
+            except EOFError:
+                process.join()
+                error = f'Solver process exited with code {process.exitcode}'
+                return stopped_part(day, part, 'error', error, progress, time.monotonic() - start)
+            if kind == 'progress':
+                progress = payload
+            elif kind == 'result':
+                return payload
+            else:
+                return stopped_part(day, part, kind, payload, progress, time.monotonic() - start)
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()